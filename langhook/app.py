@@ -24,6 +24,7 @@ from langhook.core.fastapi import (
     add_request_id_header,
     global_exception_handler,
 )
+from langhook.core.serialization import loads_json
 from langhook.ingest.config import settings as ingest_settings
 from langhook.ingest.middleware import RateLimitMiddleware
 from langhook.ingest.nats import nats_producer
@@ -364,16 +365,22 @@ async def ingest_webhook(
     headers = dict(request.headers)
 
     try:
-        # Read request body
-        body_bytes = await request.body()
+        # Read request body, unless its declared length already exceeds the limit
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > ingest_settings.max_body_bytes:
+            body_bytes = b""
+            body_size = int(content_length)
+        else:
+            body_bytes = await request.body()
+            body_size = len(body_bytes)
 
         # Check body size limit
-        if len(body_bytes) > ingest_settings.max_body_bytes:
+        if body_size > ingest_settings.max_body_bytes:
             logger.warning(
                 "Request body too large",
                 source=source,
                 request_id=request_id,
-                body_size=len(body_bytes),
+                body_size=body_size,
                 limit=ingest_settings.max_body_bytes,
             )
             raise HTTPException(
@@ -383,8 +390,8 @@ async def ingest_webhook(
 
         # Parse JSON payload
         try:
-            payload = json.loads(body_bytes)
-        except json.JSONDecodeError as e:
+            payload = loads_json(body_bytes)
+        except ValueError as e:
             # Send malformed JSON to DLQ
             await send_to_dlq(source, request_id, body_bytes, str(e), headers)
             logger.error(
@@ -421,8 +428,10 @@ async def ingest_webhook(
             "payload": payload,
         }
 
-        # Send to NATS
-        await nats_producer.send_raw_event(event_message)
+        # Send to NATS, reusing the validated body bytes as the payload when
+        # they are plain UTF-8 so the payload is not re-serialized
+        raw_payload = body_bytes if json.detect_encoding(body_bytes) == "utf-8" else None
+        await nats_producer.send_raw_event(event_message, raw_payload=raw_payload)
 
         logger.info(
             "Event ingested successfully",
@@ -1,7 +1,6 @@
 """Shared NATS producer and consumer base classes."""
 
 import asyncio
-import json
 from collections.abc import Callable
 from typing import Any
 
@@ -11,6 +10,8 @@ from nats.js import JetStreamContext
 from nats.js.api import ConsumerConfig, DeliverPolicy
 from nats.js.errors import ServiceUnavailableError
 
+from langhook.core.serialization import dumps_json, loads_json
+
 logger = structlog.get_logger("langhook")
 
 
@@ -43,7 +44,7 @@ class BaseNATSProducer:
     async def publish_message(
         self,
         subject: str,
-        message: dict[str, Any],
+        message: dict[str, Any] | bytes,
         headers: dict[str, str] | None = None,
         log_success: bool = False,
     ) -> None:
@@ -52,7 +53,7 @@ class BaseNATSProducer:
 
         Args:
             subject: NATS subject to publish to
-            message: Message data to serialize as JSON
+            message: Message data to serialize as JSON, or already-encoded JSON bytes
             headers: Optional message headers
             log_success: Whether to log successful sends
         """
@@ -60,8 +61,11 @@ class BaseNATSProducer:
             await self.start()
 
         try:
-            # Serialize message to JSON bytes
-            message_bytes = json.dumps(message).encode('utf-8')
+            # Serialize message to JSON bytes unless the caller already did
+            if isinstance(message, bytes):
+                message_bytes = message
+            else:
+                message_bytes = dumps_json(message)
 
             # Publish to JetStream
             await self.js.publish(
@@ -229,7 +233,7 @@ class BaseNATSConsumer:
                     for msg in messages:
                         try:
                             # Parse JSON message
-                            message_data = json.loads(msg.data.decode('utf-8'))
+                            message_data = loads_json(msg.data)
 
                             # Process message
                             await self.message_handler(message_data)
@@ -0,0 +1,56 @@
+"""JSON encoding helpers backed by orjson with a stdlib fallback."""
+
+import json
+import re
+from typing import Any
+
+import orjson
+
+# orjson turns integers outside the 64-bit range into floats, so input with
+# digit runs this long goes to the stdlib parser to keep them exact
+_LONG_DIGIT_RUN = re.compile(rb"\d{19,}")
+
+
+def loads_json(data: bytes) -> Any:
+    """
+    Parse JSON bytes, accepting everything ``json.loads`` accepts.
+
+    orjson handles the common case. Input it rejects (a UTF-8 BOM, ``NaN`` or
+    ``Infinity``, UTF-16/32) or would round (integers beyond 64 bits) is
+    parsed with ``json.loads`` instead.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If neither parser accepts the data
+    """
+    if not _LONG_DIGIT_RUN.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize a value to UTF-8 JSON bytes.
+
+    Values orjson rejects (non-str dict keys, integers beyond 64 bits) are
+    serialized with ``json.dumps`` instead.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON-encoded bytes
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
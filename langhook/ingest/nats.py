@@ -5,6 +5,7 @@ from typing import Any
 import structlog
 
 from langhook.core.nats import BaseNATSProducer
+from langhook.core.serialization import dumps_json
 from langhook.ingest.config import settings
 
 logger = structlog.get_logger("langhook")
@@ -73,20 +74,30 @@ class NATSEventProducer(BaseNATSProducer):
             action=canonical_data.get("action"),
         )
 
-    async def send_raw_event(self, event: dict[str, Any]) -> None:
+    async def send_raw_event(
+        self,
+        event: dict[str, Any],
+        raw_payload: bytes | None = None,
+    ) -> None:
         """
         Send raw ingest event to a processing subject.
         For now, we'll send these to a special subject for the mapper service.
         
         Args:
             event: Raw event data from ingest
+            raw_payload: Original UTF-8 JSON request body; when given it is embedded
+                verbatim as the payload instead of re-serializing event["payload"]
         """
         # Use a special subject for raw events that need processing
         subject = f"raw.{event.get('source', 'unknown')}.{event['id']}"
 
+        message: dict[str, Any] | bytes = event
+        if raw_payload is not None:
+            message = self._splice_payload(event, raw_payload)
+
         await self.publish_message(
             subject,
-            event,
+            message,
             log_success=True
         )
 
@@ -97,6 +108,21 @@ class NATSEventProducer(BaseNATSProducer):
             source=event.get("source"),
         )
 
+    @staticmethod
+    def _splice_payload(event: dict[str, Any], raw_payload: bytes) -> bytes:
+        """
+        Serialize an event envelope around already-encoded payload bytes.
+        
+        Args:
+            event: Raw event data; its "payload" entry is ignored
+            raw_payload: Valid UTF-8 JSON bytes to embed as the payload field
+            
+        Returns:
+            JSON-encoded event bytes
+        """
+        envelope = {key: value for key, value in event.items() if key != "payload"}
+        return dumps_json(envelope)[:-1] + b',"payload":' + raw_payload + b"}"
+
     async def send_dlq(self, dlq_event: dict[str, Any]) -> None:
         """
         Send malformed event to the dead letter queue subject.
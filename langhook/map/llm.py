@@ -4,10 +4,16 @@ from typing import Any
 
 import structlog
 
+from langhook.core.serialization import loads_json
 from langhook.map.config import settings
 
 logger = structlog.get_logger("langhook")
 
+# Canonical format constants for validating LLM output
+REQUIRED_CANONICAL_FIELDS = ("publisher", "resource", "action", "timestamp")
+VALID_ACTIONS = frozenset(("created", "read", "updated", "deleted"))
+INVALID_CANONICAL_ID_CHARS = ("#", " ")
+
 
 class LLMSuggestionService:
     """Service for generating JSONata mapping suggestions using LLM."""
@@ -122,9 +128,14 @@ class LLMSuggestionService:
                 lines = response_text.split('\n')
                 response_text = '\n'.join(lines[1:-1]) if len(lines) > 2 else response_text
 
+            # Reject non-object responses before paying for a parse attempt
+            if not response_text.lstrip().startswith("{"):
+                logger.error("LLM response is not a JSON object", response=response_text)
+                return None
+
             # Try to parse the response as JSON to extract both jsonata and event_field
             try:
-                response_data = json.loads(response_text)
+                response_data = loads_json(response_text.encode("utf-8"))
                 if isinstance(response_data, dict):
                     jsonata_expr = response_data.get("jsonata")
                     event_field_expr = response_data.get("event_field")
@@ -134,7 +145,6 @@ class LLMSuggestionService:
                         if isinstance(jsonata_expr, str):
                             jsonata_str = jsonata_expr.strip()
                         else:  # LLM returned an object representation
-                            import json
                             jsonata_str = json.dumps(jsonata_expr, separators=(",", ":"))
                         # Validate the JSONata expression by testing it
                         if not self._validate_jsonata_expression(jsonata_str, raw_payload, source):
@@ -154,7 +164,7 @@ class LLMSuggestionService:
                 else:
                     logger.error("LLM response is not a JSON object", response=response_text)
                     return None
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.error(
                     "Failed to parse LLM response as JSON",
                     response=response_text,
@@ -449,8 +459,7 @@ Example 6 - Salesforce Contact Updated
             return False
 
         # Validate required fields
-        required_fields = ['publisher', 'resource', 'action', 'timestamp']
-        missing_fields = [field for field in required_fields if field not in canonical_data]
+        missing_fields = [field for field in REQUIRED_CANONICAL_FIELDS if field not in canonical_data]
 
         if missing_fields:
             logger.error(
@@ -480,8 +489,7 @@ Example 6 - Salesforce Contact Updated
             return False
 
         # Validate action is CRUD enum in past tense
-        valid_actions = ['created', 'read', 'updated', 'deleted']
-        if canonical_data['action'] not in valid_actions:
+        if canonical_data['action'] not in VALID_ACTIONS:
             logger.error(
                 "LLM canonical invalid action - must be one of: created, read, updated, deleted",
                 source=source,
@@ -491,8 +499,7 @@ Example 6 - Salesforce Contact Updated
 
         # Validate atomic ID (no composite keys with # or space, but allow /)
         resource_id = str(resource['id'])
-        invalid_chars = ['#', ' ']
-        if any(char in resource_id for char in invalid_chars):
+        if any(char in resource_id for char in INVALID_CANONICAL_ID_CHARS):
             logger.error(
                 "LLM canonical resource ID contains invalid characters (#, space) - atomic IDs only",
                 source=source,
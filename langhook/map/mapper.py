@@ -10,6 +10,17 @@ from langhook.subscriptions.database import db_service
 
 logger = structlog.get_logger("langhook")
 
+# Canonical format constants, built once instead of on every mapped event
+REQUIRED_FIELDS = ("publisher", "resource", "action")
+ACTION_TENSES = {
+    "create": "created",
+    "update": "updated",
+    "delete": "deleted",
+    "read": "read",
+}
+VALID_ACTIONS = frozenset(("created", "read", "updated", "deleted"))
+INVALID_ID_CHARS = ("/", "#", " ")
+
 
 class MappingEngine:
     """Engine for applying JSONata mappings from fingerprint-based database storage."""
@@ -132,8 +143,7 @@ class MappingEngine:
                 return None
 
             # Validate new canonical format requirements
-            required_fields = ['publisher', 'resource', 'action']
-            missing_fields = [field for field in required_fields if field not in result]
+            missing_fields = [field for field in REQUIRED_FIELDS if field not in result]
 
             if missing_fields:
                 logger.error(
@@ -162,21 +172,14 @@ class MappingEngine:
                 )
                 return None
 
-            # Convert present tense actions to past tense for canonical format
-            action_mapping = {
-                'create': 'created',
-                'update': 'updated',
-                'delete': 'deleted',
-                'read': 'read'
-            }
-
-            # Support both present and past tense input
-            if result['action'] in action_mapping:
-                result['action'] = action_mapping[result['action']]
+            # Convert present tense actions to past tense for canonical format,
+            # supporting both present and past tense input
+            action = result['action']
+            if action in ACTION_TENSES:
+                result['action'] = action = ACTION_TENSES[action]
 
             # Validate action is past tense CRUD enum
-            valid_actions = ['created', 'read', 'updated', 'deleted']
-            if result['action'] not in valid_actions:
+            if action not in VALID_ACTIONS:
                 logger.error(
                     "Invalid action - must be one of: created, read, updated, deleted",
                     source=source,
@@ -186,8 +189,7 @@ class MappingEngine:
 
             # Validate atomic ID (no composite keys with /, #, or space)
             resource_id = str(resource['id'])
-            invalid_chars = ['/', '#', ' ']
-            if any(char in resource_id for char in invalid_chars):
+            if any(char in resource_id for char in INVALID_ID_CHARS):
                 logger.error(
                     "Resource ID contains invalid characters (/, #, space) - atomic IDs only",
                     source=source,
@@ -1,12 +1,15 @@
 """LLM Gate service for semantic event filtering."""
 
+import asyncio
 import json
 import time
 from typing import Any
 
+import orjson
 import structlog
 from prometheus_client import Counter, Histogram
 
+from langhook.core.serialization import dumps_json
 from langhook.subscriptions.llm import LLMPatternService
 
 logger = structlog.get_logger("langhook")
@@ -24,6 +27,42 @@ gate_evaluation_duration = Histogram(
     ["subscription_id"]
 )
 
+_JSON_DECODER = json.JSONDecoder()
+
+GATE_SYSTEM_PROMPT = """You are an intelligent event filter for a subscription monitoring system.
+
+Your task is to evaluate whether an incoming event matches a user's subscription criteria.
+
+You will be given:
+1. A user's subscription intent (what they want to be notified about)
+2. Event data to evaluate
+
+You must determine if the event matches the user's specific criteria and return your decision.
+
+Return ONLY a JSON object with this exact format:
+{
+    "decision": true or false,
+    "reasoning": "Brief explanation of why the event matches or doesn't match the criteria"
+}
+
+Be precise and selective:
+- Only return true if the event clearly matches the user's specific requirements
+- Consider exact criteria like names, states, actions, and conditions
+- When in doubt, err on the side of being conservative (return false)
+- Always provide clear reasoning for your decision"""
+
+
+def _extract_first_json(text: str) -> Any:
+    """Decode the first JSON object embedded in text, ignoring surrounding prose and code fences."""
+    start = text.find("{")
+    while start != -1:
+        try:
+            # raw_decode stops at the end of the object, so trailing text is ignored
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+    raise ValueError("No JSON object found")
+
 
 class LLMGateService:
     """Service for evaluating events against LLM gates."""
@@ -50,6 +89,9 @@ class LLMGateService:
         Returns:
             Tuple of (should_pass, reason)
         """
+        if not gate_config.get("enabled", False):
+            return True, "Gate disabled"
+
         start_time = time.time()
 
         try:
@@ -129,36 +171,44 @@ class LLMGateService:
 
             return True, reason
 
+    async def evaluate_events(
+        self,
+        evaluations: list[tuple[dict[str, Any], dict[str, Any], int]]
+    ) -> list[tuple[bool, str]]:
+        """
+        Evaluate several events concurrently.
+
+        Args:
+            evaluations: (event_data, gate_config, subscription_id) tuples
+
+        Returns:
+            List of (should_pass, reason) tuples in the same order as the input
+        """
+        results = await asyncio.gather(
+            *(
+                self.evaluate_event(event_data, gate_config, subscription_id)
+                for event_data, gate_config, subscription_id in evaluations
+            ),
+            return_exceptions=True
+        )
+
+        # evaluate_event already fails open; this only covers errors it lets through
+        return [
+            (True, f"Gate evaluation error: {str(result)} - failing open")
+            if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
     def _create_user_prompt(self, gate_criteria: str, event_data: dict[str, Any]) -> str:
         """Create user prompt with gate criteria and event data."""
         return f"""{gate_criteria}
 
 Event to evaluate:
-{json.dumps(event_data, indent=2)}"""
+{dumps_json(event_data, indent=True).decode()}"""
 
     def _create_system_prompt(self) -> str:
         """Create system prompt for LLM gate evaluation."""
-        return """You are an intelligent event filter for a subscription monitoring system.
-
-Your task is to evaluate whether an incoming event matches a user's subscription criteria.
-
-You will be given:
-1. A user's subscription intent (what they want to be notified about)
-2. Event data to evaluate
-
-You must determine if the event matches the user's specific criteria and return your decision.
-
-Return ONLY a JSON object with this exact format:
-{
-    "decision": true or false,
-    "reasoning": "Brief explanation of why the event matches or doesn't match the criteria"
-}
-
-Be precise and selective:
-- Only return true if the event clearly matches the user's specific requirements
-- Consider exact criteria like names, states, actions, and conditions
-- When in doubt, err on the side of being conservative (return false)
-- Always provide clear reasoning for your decision"""
+        return GATE_SYSTEM_PROMPT
 
     async def _query_llm(self, user_prompt: str) -> str:
         """Query the LLM with system and user prompts."""
@@ -191,23 +241,11 @@ Be precise and selective:
             # Try to extract JSON from the response
             response = response.strip()
             logger.info("Parsing LLM response:" + response)
-            # Handle code blocks
-            if "```json" in response:
-                start = response.find("```json") + 7
-                end = response.find("```", start)
-                response = response[start:end].strip()
-            elif "```" in response:
-                start = response.find("```") + 3
-                end = response.find("```", start)
-                response = response[start:end].strip()
-
-            # Try to find JSON object
-            if "{" in response and "}" in response:
-                start = response.find("{")
-                end = response.rfind("}") + 1
-                response = response[start:end]
-
-            parsed = json.loads(response)
+            try:
+                # Most responses are already bare JSON
+                parsed = orjson.loads(response)
+            except orjson.JSONDecodeError:
+                parsed = _extract_first_json(response)
 
             # Validate required fields
             if "decision" not in parsed:
@@ -1,6 +1,7 @@
 """Large Language Model service for converting descriptions to NATS filter patterns."""
 
 import re
+import time
 from typing import Any
 
 import structlog
@@ -9,6 +10,23 @@ from langhook.subscriptions.config import subscription_settings
 
 logger = structlog.get_logger("langhook")
 
+# Seconds a cached pattern prompt is reused. Bounds staleness from registry
+# writes made by other processes and from newer sample events.
+PROMPT_CACHE_TTL_SECONDS = 60.0
+
+# (schema registry version, monotonic build time, prompt) of the last prompt built
+_prompt_cache: tuple[int, float, str] | None = None
+
+# NATS subject pattern: langhook.events.<publisher>.<resource_type>.<resource_id>.<action>
+_EVENT_PATTERN_RE = re.compile(r"langhook\.events\.([a-z0-9_\-*>]+\.){3}[a-z0-9_\-*>]+")
+
+# Phrases the LLM uses to say no registered schema fits the request; covers
+# "ERROR: No suitable schema found" and "ERROR: No registered schemas available"
+_NO_SCHEMA_RE = re.compile(
+    r"no suitable schema|no registered schemas|cannot be mapped|not available in|schema not found",
+    re.IGNORECASE
+)
+
 
 class NoSuitableSchemaError(Exception):
     """Raised when no suitable schema is found for the subscription request."""
@@ -233,10 +251,22 @@ class LLMPatternService:
         return result["pattern"]
 
     async def _get_system_prompt_with_schemas(self) -> str:
-        """Get the system prompt for pattern conversion with real schema data."""
+        """Get the system prompt for pattern conversion with real schema data.
+
+        Prompts built from a successfully fetched schema summary are reused
+        while the schema registry version is unchanged, for up to
+        PROMPT_CACHE_TTL_SECONDS.
+        """
+        global _prompt_cache
         # Import here to avoid circular imports
         from langhook.subscriptions.schema_registry import schema_registry_service
 
+        version = schema_registry_service.version
+        if _prompt_cache is not None:
+            cached_version, built_at, cached_prompt = _prompt_cache
+            if cached_version == version and time.monotonic() - built_at < PROMPT_CACHE_TTL_SECONDS:
+                return cached_prompt
+
         try:
             schema_data = await schema_registry_service.get_schema_summary(include_samples=True)
         except Exception as e:
@@ -244,13 +274,19 @@ class LLMPatternService:
                 "Failed to fetch schema data for prompt, using fallback",
                 error=str(e)
             )
-            schema_data = {
+            return self._build_system_prompt({
                 "publishers": [],
                 "resource_types": {},
                 "actions": [],
                 "publisher_resource_actions": {}
-            }
+            })
 
+        prompt = self._build_system_prompt(schema_data)
+        _prompt_cache = (version, time.monotonic(), prompt)
+        return prompt
+
+    def _build_system_prompt(self, schema_data: dict[str, Any]) -> str:
+        """Build the pattern conversion system prompt from a schema summary."""
         # Build schema information for the prompt
         if not schema_data["publishers"]:
             # No schemas available, include instruction to reject
@@ -391,30 +427,18 @@ Pattern:"""
 
     def _is_no_schema_response(self, response: str) -> bool:
         """Check if the LLM response indicates no suitable schema was found."""
-        response_lower = response.lower().strip()
-        error_indicators = [
-            "error: no suitable schema found",
-            "error: no registered schemas available",
-            "no suitable schema",
-            "no registered schemas",
-            "cannot be mapped",
-            "not available in",
-            "schema not found"
-        ]
-        return any(indicator in response_lower for indicator in error_indicators)
+        return _NO_SCHEMA_RE.search(response) is not None
 
     def _extract_pattern_from_response(self, response: str) -> str | None:
         """Extract the NATS pattern from the LLM response."""
         # Look for a pattern that matches the new NATS subject format with langhook.events prefix
-        pattern_regex = r'langhook\.events\.([a-z0-9_\-*>]+\.){3}[a-z0-9_\-*>]+'
-
-        match = re.search(pattern_regex, response.lower())
+        match = _EVENT_PATTERN_RE.search(response.lower())
         if match:
             return match.group(0)
 
         # If no pattern found, check if the entire response looks like a pattern
         cleaned = response.strip().lower()
-        if re.match(r'^langhook\.events\.([a-z0-9_\-*>]+\.){3}[a-z0-9_\-*>]+$', cleaned):
+        if _EVENT_PATTERN_RE.fullmatch(cleaned):
             return cleaned
 
         return None
@@ -1,8 +1,11 @@
 """Prompt library for LLM Gate templates."""
 
 import os
+import sys
 import yaml
-from typing import Dict, Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import structlog
 
@@ -15,17 +18,24 @@ class PromptLibrary:
     def __init__(self, prompts_dir: str = None) -> None:
         """Initialize the prompt library."""
         self.prompts_dir = prompts_dir or os.path.join(os.path.dirname(__file__), "..", "..", "prompts")
-        self.templates: Dict[str, str] = {}
+        # Read-only view; replaced wholesale on each load
+        self.templates: Mapping[str, str] = MappingProxyType({})
         self.load_templates()
 
     def load_templates(self) -> None:
         """Load prompt templates from YAML files."""
+        # Drop summaries built from the previous templates
+        self.__dict__.pop("_template_summaries", None)
         try:
             templates_file = os.path.join(self.prompts_dir, "gate_templates.yaml")
             if os.path.exists(templates_file):
                 with open(templates_file, 'r', encoding='utf-8') as f:
                     data = yaml.safe_load(f)
-                    self.templates = data.get("templates", {})
+                    # Interned names hash and compare by identity on lookup
+                    self.templates = MappingProxyType({
+                        sys.intern(name): template
+                        for name, template in data.get("templates", {}).items()
+                    })
                 logger.info(f"Loaded {len(self.templates)} prompt templates", prompts_dir=self.prompts_dir)
             else:
                 logger.warning("No prompt templates file found, using defaults", templates_file=templates_file)
@@ -36,7 +46,7 @@ class PromptLibrary:
 
     def _load_default_templates(self) -> None:
         """Load default prompt templates."""
-        self.templates = {
+        self.templates = MappingProxyType({
             "default": """You are an intelligent event filter for a subscription monitoring system.
 
 The user has subscribed to: "{description}"
@@ -143,15 +153,23 @@ Allow ONLY if the event matches the user's exact specification including:
 - Precise criteria outlined in the description
 
 Block anything that doesn't precisely match the user's stated requirements."""
-        }
+        })
 
     def get_template(self, template_name: str) -> str:
         """Get a prompt template by name."""
         return self.templates.get(template_name, self.templates.get("default", ""))
 
-    def list_templates(self) -> Dict[str, str]:
-        """List all available templates."""
-        return {name: template[:100] + "..." for name, template in self.templates.items()}
+    def list_templates(self) -> Mapping[str, str]:
+        """List all available templates as a read-only view of the cached summaries."""
+        return self._template_summaries
+
+    @cached_property
+    def _template_summaries(self) -> Mapping[str, str]:
+        """Template summaries truncated to 100 characters, built once per load."""
+        return MappingProxyType({
+            name: template[:100] + "..." if len(template) > 100 else template
+            for name, template in self.templates.items()
+        })
 
     def reload_templates(self) -> None:
         """Reload templates from disk."""
@@ -53,7 +53,9 @@ async def create_subscription(
             # 1. If user provided a custom gate prompt, use that (already set)
             # 2. If no custom gate prompt provided, use the subscription description
             if gate_enabled and not subscription_data.gate.prompt:
-                subscription_data.gate.prompt = subscription_data.description
+                subscription_data.gate = subscription_data.gate.model_copy(
+                    update={"prompt": subscription_data.description}
+                )
                 logger.info(
                     "Using subscription description as gate prompt",
                     subscriber_id=subscriber_id,
@@ -343,7 +345,9 @@ async def update_subscription(
                         from langhook.subscriptions.schemas import GateConfig
                         update_data.gate = GateConfig(enabled=True, prompt=result["gate_prompt"])
                     else:
-                        update_data.gate.prompt = result["gate_prompt"]
+                        update_data.gate = update_data.gate.model_copy(
+                            update={"prompt": result["gate_prompt"]}
+                        )
 
                     logger.info(
                         "Auto-generated gate prompt for subscription update",
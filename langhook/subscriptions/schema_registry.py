@@ -15,6 +15,10 @@ logger = structlog.get_logger("langhook")
 class SchemaRegistryService:
     """Service for managing the event schema registry."""
 
+    def __init__(self) -> None:
+        # Bumped on every registry change made by this process
+        self.version = 0
+
     async def register_event_schema(
         self,
         publisher: str,
@@ -38,13 +42,17 @@ class SchemaRegistryService:
                     ON CONFLICT (publisher, resource_type, action) DO NOTHING
                 """)
 
-                session.execute(insert_stmt, {
+                result = session.execute(insert_stmt, {
                     'publisher': publisher,
                     'resource_type': resource_type,
                     'action': action
                 })
                 session.commit()
 
+                # Conflicting rows are skipped, so only new combinations bump the version
+                if result.rowcount:
+                    self.version += 1
+
                 logger.debug(
                     "Schema registry entry processed",
                     publisher=publisher,
@@ -228,6 +236,7 @@ class SchemaRegistryService:
                 )
                 deleted_count = delete_query.delete()
                 session.commit()
+                self.version += 1
 
                 logger.info(
                     "Publisher deleted from schema registry",
@@ -287,6 +296,7 @@ class SchemaRegistryService:
                 )
                 deleted_count = delete_query.delete()
                 session.commit()
+                self.version += 1
 
                 logger.info(
                     "Resource type deleted from schema registry",
@@ -348,6 +358,7 @@ class SchemaRegistryService:
                 # Delete the entry
                 session.delete(entry)
                 session.commit()
+                self.version += 1
 
                 logger.info(
                     "Action deleted from schema registry",
@@ -3,7 +3,16 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+SUPPORTED_CHANNEL_TYPES = frozenset({"webhook"})
+
+
+def _validate_channel_type(v: str | None) -> str | None:
+    """Reject channel types other than the supported ones."""
+    if v is not None and v not in SUPPORTED_CHANNEL_TYPES:
+        raise ValueError('channel_type must be: webhook')
+    return v
 
 
 class ChannelConfig(BaseModel):
@@ -20,6 +29,8 @@ class WebhookChannelConfig(ChannelConfig):
 
 class GateConfig(BaseModel):
     """LLM gate configuration for subscription filtering."""
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(default=False, description="Whether the LLM gate is enabled")
     prompt: str = Field(default="", description="Prompt for gate evaluation")
 
@@ -32,12 +43,7 @@ class SubscriptionCreate(BaseModel):
     gate: GateConfig | None = Field(None, description="LLM gate configuration")
     disposable: bool = Field(False, description="Whether this subscription is for one-time use only")
 
-    @field_validator('channel_type')
-    @classmethod
-    def validate_channel_type(cls, v):
-        if v is not None and v not in ['webhook']:
-            raise ValueError('channel_type must be: webhook')
-        return v
+    validate_channel_type = field_validator('channel_type')(_validate_channel_type)
 
 
 class SubscriptionUpdate(BaseModel):
@@ -49,12 +55,7 @@ class SubscriptionUpdate(BaseModel):
     gate: GateConfig | None = None
     disposable: bool | None = None
 
-    @field_validator('channel_type')
-    @classmethod
-    def validate_channel_type(cls, v):
-        if v is not None and v not in ['webhook']:
-            raise ValueError('channel_type must be: webhook')
-        return v
+    validate_channel_type = field_validator('channel_type')(_validate_channel_type)
 
 
 class SubscriptionResponse(BaseModel):
@@ -0,0 +1,178 @@
+"""Shared pytest fixtures for the unit test suite."""
+
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+FRONTEND_DIR = Path(__file__).parent.parent / "frontend"
+STATIC_DIR = Path(__file__).parent.parent / "langhook" / "static"
+NPM_CACHE_DIR = Path.home() / ".cache" / "npm-langhook"
+
+# Wall-time budgets in seconds for the test call phases under each path prefix,
+# summed per session. They catch fixtures that stop being shared and
+# accidental per-test rebuilds. Under xdist the controller receives every
+# worker's reports, so it checks the budgets against the whole run.
+DURATION_BUDGETS = {
+    # One patched ASGI client for the whole module
+    "tests/test_app.py": 3.0,
+    # At most two cold npm builds, one per SERVER_PATH
+    "tests/test_frontend_build.py": 120.0,
+}
+
+_durations: dict[str, float] = dict.fromkeys(DURATION_BUDGETS, 0.0)
+
+
+def _frontend_env() -> dict[str, str]:
+    """Environment for npm commands, sharing one npm cache directory across runs."""
+    env = os.environ.copy()
+    env.setdefault("npm_config_cache", str(NPM_CACHE_DIR))
+    return env
+
+
+def _ensure_node_modules() -> None:
+    """Install frontend dependencies if node_modules is missing or older than the lockfile."""
+    node_modules = FRONTEND_DIR / "node_modules"
+    lockfile = FRONTEND_DIR / "package-lock.json"
+    if node_modules.exists() and node_modules.stat().st_mtime >= lockfile.stat().st_mtime:
+        return
+
+    result = subprocess.run(
+        ["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"],
+        cwd=FRONTEND_DIR,
+        env=_frontend_env(),
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, f"npm ci failed: {result.stderr}"
+
+
+def _src_fingerprint(server_path: str) -> str:
+    """Hash the frontend sources, lockfile and SERVER_PATH that determine a build."""
+    digest = hashlib.blake2b(digest_size=16)
+    sources = sorted(path for path in (FRONTEND_DIR / "src").rglob("*") if path.is_file())
+    for path in [*sources, FRONTEND_DIR / "package-lock.json"]:
+        if path.exists():
+            digest.update(str(path.relative_to(FRONTEND_DIR)).encode())
+            digest.update(path.read_bytes())
+    digest.update(server_path.encode())
+    return digest.hexdigest()
+
+
+class FrontendBuilds(dict):
+    """Built ``main.*.js`` contents keyed by SERVER_PATH, built on first access.
+
+    When the pytest cache is available, bundles are kept there alongside the
+    fingerprint of the inputs they were built from, so unchanged sources skip
+    ``npm run build`` entirely on later runs.
+    """
+
+    def __init__(self, cache: pytest.Cache | None) -> None:
+        super().__init__()
+        self.cache = cache
+        self._dependencies_installed = False
+
+    def __missing__(self, server_path: str) -> str:
+        fingerprint = _src_fingerprint(server_path)
+        name = server_path.strip("/").replace("/", "_") or "default"
+        key = f"frontend/fingerprint/{name}"
+        bundle = self.cache.mkdir("frontend-builds") / f"{name}.js" if self.cache else None
+
+        if bundle and bundle.exists() and self.cache.get(key, None) == fingerprint:
+            self[server_path] = bundle.read_text()
+            return self[server_path]
+
+        if not self._dependencies_installed:
+            _ensure_node_modules()
+            self._dependencies_installed = True
+
+        env = _frontend_env()
+        if server_path:
+            env["SERVER_PATH"] = server_path
+        else:
+            env.pop("SERVER_PATH", None)
+
+        result = subprocess.run(
+            ["npm", "run", "build"],
+            cwd=FRONTEND_DIR,
+            env=env,
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 0, f"Build failed: {result.stderr}"
+
+        js_files = list((STATIC_DIR / "static" / "js").glob("main.*.js"))
+        assert len(js_files) > 0, "No main JS file found"
+
+        # Later builds overwrite the bundle, so keep the content, not the path
+        self[server_path] = js_files[0].read_text()
+        if bundle:
+            bundle.write_text(self[server_path])
+            self.cache.set(key, fingerprint)
+        return self[server_path]
+
+
+@pytest.fixture(scope="session")
+def built_js(pytestconfig):
+    """Frontend bundle per SERVER_PATH, so each variant is built at most once per session."""
+    return FrontendBuilds(getattr(pytestconfig, "cache", None))
+
+
+@pytest.fixture
+def patched_schema_registry(monkeypatch):
+    """Stub ``get_schema_summary`` on the shared schema registry service.
+
+    Set ``return_value`` or ``side_effect`` on the returned mock. The cached
+    pattern prompt is cleared so each test builds its prompt from the stub.
+    """
+    from langhook.subscriptions import llm
+    from langhook.subscriptions.schema_registry import schema_registry_service
+
+    mock = AsyncMock()
+    monkeypatch.setattr(schema_registry_service, "get_schema_summary", mock)
+    monkeypatch.setattr(llm, "_prompt_cache", None)
+    return mock
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate call durations for the budgeted test modules."""
+    if report.when != "call":
+        return
+    for prefix in DURATION_BUDGETS:
+        if report.nodeid.startswith(prefix):
+            _durations[prefix] += report.duration
+
+
+def _over_budget() -> dict[str, float]:
+    return {
+        prefix: spent
+        for prefix, spent in _durations.items()
+        if spent > DURATION_BUDGETS[prefix]
+    }
+
+
+def _is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Fail the run when a budgeted module exceeds its duration budget."""
+    if _is_xdist_worker(session.config):
+        return
+    if _over_budget() and exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report test modules that exceeded their duration budget."""
+    if _is_xdist_worker(terminalreporter.config):
+        return
+    for prefix, spent in _over_budget().items():
+        terminalreporter.write_line(
+            f"Duration budget exceeded: {prefix} took {spent:.2f}s "
+            f"(budget {DURATION_BUDGETS[prefix]:.1f}s)",
+            red=True,
+        )
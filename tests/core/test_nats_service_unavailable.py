@@ -1,6 +1,7 @@
 """Test NATS consumer handling of ServiceUnavailableError."""
 
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, call, patch
 
 import pytest
 from nats.js.errors import ServiceUnavailableError
@@ -8,17 +9,27 @@ from nats.js.errors import ServiceUnavailableError
 from langhook.core.nats import BaseNATSConsumer
 
 
+def _asyncio_with_mock_sleep():
+    """Stand-in for the ``asyncio`` name in ``langhook.core.nats`` only.
+
+    Patching ``asyncio.sleep`` itself would replace it for the whole process.
+    """
+    return SimpleNamespace(sleep=AsyncMock())
+
+
 class TestServiceUnavailableErrorHandling:
     """Test proper handling of ServiceUnavailableError in NATS consumer."""
 
-    @pytest.fixture
-    def mock_handler(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_handler(cls):
         """Create a mock message handler."""
         return AsyncMock()
 
-    @pytest.fixture
-    def consumer(self, mock_handler):
-        """Create a test NATS consumer."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def consumer(cls, mock_handler):
+        """Create a test NATS consumer shared by the class."""
         return BaseNATSConsumer(
             nats_url="nats://localhost:4222",
             stream_name="test_stream",
@@ -27,14 +38,33 @@ class TestServiceUnavailableErrorHandling:
             message_handler=mock_handler,
         )
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def nats_mocks(cls):
+        """NATS connection, JetStream and subscription mocks shared by the class."""
+        return SimpleNamespace(nc=AsyncMock(), js=AsyncMock(), subscription=AsyncMock())
+
+    @pytest.fixture(autouse=True)
+    def reset_consumer(self, consumer, mock_handler, nats_mocks):
+        """Restore the shared consumer, handler and NATS mocks after each test."""
+        yield
+        for mock in vars(nats_mocks).values():
+            mock.reset_mock(side_effect=True)
+        consumer.nc = None
+        consumer.js = None
+        consumer._subscription = None
+        consumer._running = False
+        for method in ("start", "_reset_connection"):
+            vars(consumer).pop(method, None)
+        mock_handler.reset_mock()
+
     @pytest.mark.asyncio
-    async def test_service_unavailable_error_triggers_reset(self, consumer, mock_handler):
+    @patch("langhook.core.nats.asyncio", new_callable=_asyncio_with_mock_sleep)
+    async def test_service_unavailable_error_triggers_reset(self, mock_asyncio, consumer, mock_handler, nats_mocks):
         """Test that ServiceUnavailableError triggers connection reset after max consecutive errors."""
 
         # Mock the NATS connection and JetStream
-        mock_nc = AsyncMock()
-        mock_js = AsyncMock()
-        mock_subscription = AsyncMock()
+        mock_nc, mock_js, mock_subscription = nats_mocks.nc, nats_mocks.js, nats_mocks.subscription
 
         consumer.nc = mock_nc
         consumer.js = mock_js
@@ -77,14 +107,15 @@ class TestServiceUnavailableErrorHandling:
         assert reset_called, "Connection reset should have been called after max consecutive errors"
         assert service_unavailable_call_count == 4, "Should have attempted 4 fetches (3 errors + 1 success)"
 
+        # Backoff doubles before the reset, without waiting on the real clock
+        assert mock_asyncio.sleep.await_args_list == [call(2.0), call(4.0)]
+
     @pytest.mark.asyncio
-    async def test_service_unavailable_error_basic_handling(self, consumer, mock_handler):
+    async def test_service_unavailable_error_basic_handling(self, consumer, mock_handler, nats_mocks):
         """Test basic ServiceUnavailableError handling without full loop testing."""
 
         # Mock the NATS connection and JetStream
-        mock_nc = AsyncMock()
-        mock_js = AsyncMock()
-        mock_subscription = AsyncMock()
+        mock_nc, mock_js, mock_subscription = nats_mocks.nc, nats_mocks.js, nats_mocks.subscription
 
         consumer.nc = mock_nc
         consumer.js = mock_js
@@ -134,13 +165,21 @@ class TestServiceUnavailableErrorHandling:
         assert backoff_3 == 8.0
 
     @pytest.mark.asyncio
-    async def test_reset_connection_cleanup(self, consumer, mock_handler):
-        """Test that _reset_connection properly cleans up existing connections."""
+    @pytest.mark.parametrize(
+        ("unsubscribe_error", "close_error"),
+        [
+            (None, None),
+            (Exception("Cleanup error"), Exception("Close error")),
+        ],
+        ids=["clean", "cleanup_errors"],
+    )
+    async def test_reset_connection_cleanup(self, consumer, nats_mocks, unsubscribe_error, close_error):
+        """Test that _reset_connection cleans up and reconnects, tolerating cleanup errors."""
 
         # Mock the NATS connection and subscription
-        mock_nc = AsyncMock()
-        mock_js = AsyncMock()
-        mock_subscription = AsyncMock()
+        mock_nc, mock_js, mock_subscription = nats_mocks.nc, nats_mocks.js, nats_mocks.subscription
+        mock_subscription.unsubscribe.side_effect = unsubscribe_error
+        mock_nc.close.side_effect = close_error
 
         consumer.nc = mock_nc
         consumer.js = mock_js
@@ -149,10 +188,10 @@ class TestServiceUnavailableErrorHandling:
         # Mock start method to avoid actual connection
         consumer.start = AsyncMock()
 
-        # Call reset_connection
+        # Call reset_connection - should not raise despite cleanup errors
         await consumer._reset_connection()
 
-        # Verify cleanup was attempted
+        # Verify cleanup was attempted and state was reset either way
         mock_subscription.unsubscribe.assert_called_once()
         mock_nc.close.assert_called_once()
         assert consumer._subscription is None
@@ -161,32 +200,3 @@ class TestServiceUnavailableErrorHandling:
 
         # Verify start was called to re-establish connection
         consumer.start.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_reset_connection_handles_cleanup_errors(self, consumer, mock_handler):
-        """Test that _reset_connection handles errors during cleanup gracefully."""
-
-        # Mock the NATS connection and subscription that raise errors during cleanup
-        mock_nc = AsyncMock()
-        mock_js = AsyncMock()
-        mock_subscription = AsyncMock()
-
-        # Make cleanup methods raise exceptions
-        mock_subscription.unsubscribe.side_effect = Exception("Cleanup error")
-        mock_nc.close.side_effect = Exception("Close error")
-
-        consumer.nc = mock_nc
-        consumer.js = mock_js
-        consumer._subscription = mock_subscription
-
-        # Mock start method to avoid actual connection
-        consumer.start = AsyncMock()
-
-        # Call reset_connection - should not raise despite cleanup errors
-        await consumer._reset_connection()
-
-        # Verify that despite errors, cleanup variables were reset and start was called
-        assert consumer._subscription is None
-        assert consumer.nc is None
-        assert consumer.js is None
-        consumer.start.assert_called_once()
@@ -0,0 +1,65 @@
+"""Test the orjson-backed JSON helpers and their stdlib fallback."""
+
+import json
+import math
+
+import pytest
+
+from langhook.core.serialization import dumps_json, loads_json
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (b'{"a": 1}', {"a": 1}),
+        (b'\xef\xbb\xbf{"a": 1}', {"a": 1}),
+        ('{"a": 1}'.encode("utf-16"), {"a": 1}),
+        (b'{"id": 123456789012345678901234567890}', {"id": 123456789012345678901234567890}),
+        (b'{"id": -9223372036854775809}', {"id": -9223372036854775809}),
+    ],
+    ids=["plain", "utf8_bom", "utf16", "big_int", "below_int64"],
+)
+def test_loads_json_accepts_stdlib_input(data, expected):
+    """Test that input json.loads accepts parses to the same value."""
+    result = loads_json(data)
+    assert result == expected
+    assert type(next(iter(result.values()))) is int
+
+
+@pytest.mark.parametrize("literal", [b"NaN", b"Infinity", b"-Infinity"])
+def test_loads_json_accepts_non_finite_numbers(literal):
+    """Test that NaN and Infinity literals parse as they did with json.loads."""
+    value = loads_json(b'{"v": ' + literal + b"}")["v"]
+    assert not math.isfinite(value)
+
+
+@pytest.mark.parametrize("data", [b"invalid json {", b"\xff\xfe\xfd"])
+def test_loads_json_rejects_invalid_input(data):
+    """Test that malformed input raises ValueError."""
+    with pytest.raises(ValueError):
+        loads_json(data)
+
+
+def test_dumps_json_uses_orjson_encoding():
+    """Test that plain values serialize compactly with orjson."""
+    assert dumps_json({"a": [1, "b"]}) == b'{"a":[1,"b"]}'
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{1: "one", None: "none"}, {"id": 2 ** 64}],
+    ids=["non_str_keys", "big_int"],
+)
+def test_dumps_json_falls_back_for_values_orjson_rejects(value):
+    """Test that values orjson cannot encode serialize like json.dumps."""
+    assert dumps_json(value) == json.dumps(value).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{"a": [1, "b"]}, {"id": 2 ** 64}],
+    ids=["plain", "big_int"],
+)
+def test_dumps_json_indents_like_json_dumps(value):
+    """Test that indented output matches json.dumps with indent=2."""
+    assert dumps_json(value, indent=True) == json.dumps(value, indent=2).encode("utf-8")
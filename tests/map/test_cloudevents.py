@@ -100,6 +100,25 @@ def test_wrap_and_validate():
     assert cloud_event["data"]["resource"]["id"] == 456
 
 
+def test_envelope_attributes_use_publisher():
+    """Test that the envelope source, type and subject are derived from the canonical event."""
+    wrapper = CloudEventWrapper()
+
+    canonical_event = {
+        "publisher": "stripe",
+        "resource": {"type": "payment_intent", "id": "pi_123"},
+        "action": "updated",
+        "timestamp": "2025-06-03T15:45:02Z",
+        "payload": {}
+    }
+    cloud_event = wrapper.create_cloudevents_envelope("evt-1", canonical_event)
+
+    assert cloud_event["source"] == "/stripe"
+    assert cloud_event["type"] == "com.stripe.payment_intent.updated"
+    assert cloud_event["subject"] == "payment_intent/pi_123"
+    assert cloud_event["time"] == "2025-06-03T15:45:02Z"
+
+
 def test_field_path_evaluation_in_subject():
     """Test that field paths in resource IDs are properly evaluated in the subject."""
     wrapper = CloudEventWrapper()
@@ -93,6 +93,58 @@ async def test_transform_to_canonical_missing_fields(mock_llm_service):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_jsonata_generation_rejects_non_object_response(mock_llm_service):
+    """Test that non-object LLM responses are rejected before JSON parsing."""
+    mock_response = Mock()
+    mock_response.generations = [[Mock()]]
+    mock_response.generations[0][0].text = '"publisher": "github"'
+
+    mock_llm_service.llm.agenerate = AsyncMock(return_value=mock_response)
+
+    result = await mock_llm_service.generate_jsonata_mapping_with_event_field(
+        "github", {"action": "opened"}
+    )
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_jsonata_generation_accepts_fenced_object_with_leading_whitespace(mock_llm_service):
+    """Test that an object left with leading whitespace after fence stripping still parses."""
+    pytest.importorskip("langchain.schema")
+    mock_response = Mock()
+    mock_response.generations = [[Mock()]]
+    mock_response.generations[0][0].text = '```json\n\n  {"jsonata": "{\\"action\\": action}", "event_field": "action"}\n```'
+
+    mock_llm_service.llm.agenerate = AsyncMock(return_value=mock_response)
+    mock_llm_service._validate_jsonata_expression = Mock(return_value=True)
+
+    result = await mock_llm_service.generate_jsonata_mapping_with_event_field(
+        "github", {"action": "opened"}
+    )
+
+    assert result == ('{"action": action}', "action")
+
+
+@pytest.mark.asyncio
+async def test_jsonata_generation_keeps_long_integers_exact(mock_llm_service):
+    """Test that integers beyond 64 bits in an object expression are not rounded."""
+    pytest.importorskip("langchain.schema")
+    mock_response = Mock()
+    mock_response.generations = [[Mock()]]
+    mock_response.generations[0][0].text = '{"jsonata": {"id": 123456789012345678901}, "event_field": "action"}'
+
+    mock_llm_service.llm.agenerate = AsyncMock(return_value=mock_response)
+    mock_llm_service._validate_jsonata_expression = Mock(return_value=True)
+
+    result = await mock_llm_service.generate_jsonata_mapping_with_event_field(
+        "github", {"action": "opened"}
+    )
+
+    assert result == ('{"id":123456789012345678901}', "action")
+
+
 @pytest.mark.asyncio
 async def test_llm_service_initialization_failure():
     """Test that LLM service fails to initialize when not properly configured."""
@@ -4,6 +4,7 @@ import asyncio
 from unittest.mock import AsyncMock, patch
 
 from langhook.map.service import MappingService
+from tests.utils import FastAsyncStub
 
 
 async def test_llm_transformation_flow():
@@ -14,8 +15,8 @@ async def test_llm_transformation_flow():
     with patch('langhook.map.service.map_producer') as mock_producer, \
          patch('langhook.map.service.llm_service') as mock_llm:
 
-        mock_producer.send_canonical_event = AsyncMock()
-        mock_producer.send_mapping_failure = AsyncMock()
+        mock_producer.send_canonical_event = FastAsyncStub()
+        mock_producer.send_mapping_failure = FastAsyncStub()
 
         # Mock LLM service to be available and return JSONata expression
         mock_llm.is_available.return_value = True
@@ -77,8 +78,8 @@ async def test_llm_unavailable_flow():
     with patch('langhook.map.service.map_producer') as mock_producer, \
          patch('langhook.map.service.llm_service') as mock_llm:
 
-        mock_producer.send_canonical_event = AsyncMock()
-        mock_producer.send_mapping_failure = AsyncMock()
+        mock_producer.send_canonical_event = FastAsyncStub()
+        mock_producer.send_mapping_failure = FastAsyncStub()
 
         # Mock LLM service to be unavailable
         mock_llm.is_available.return_value = False
@@ -129,8 +130,8 @@ async def test_llm_transformation_failure():
     with patch('langhook.map.service.map_producer') as mock_producer, \
          patch('langhook.map.service.llm_service') as mock_llm:
 
-        mock_producer.send_canonical_event = AsyncMock()
-        mock_producer.send_mapping_failure = AsyncMock()
+        mock_producer.send_canonical_event = FastAsyncStub()
+        mock_producer.send_mapping_failure = FastAsyncStub()
 
         # Mock LLM service to be available but return None (JSONata generation failed)
         mock_llm.is_available.return_value = True
@@ -168,6 +169,28 @@ async def test_llm_transformation_failure():
         print("✅ LLM transformation failure test passed!")
 
 
+async def test_failed_canonical_publish_reaches_failure_path():
+    """Test that a canonical publish error is sent to the DLQ instead of counting as mapped."""
+    with patch('langhook.map.service.map_producer') as mock_producer, \
+         patch('langhook.map.service.mapping_engine') as mock_engine, \
+         patch('langhook.map.service.cloud_event_wrapper') as mock_wrapper, \
+         patch('langhook.map.service.schema_registry_service'), \
+         patch('langhook.map.service.metrics'):
+
+        mock_engine.apply_mapping = AsyncMock(return_value={"publisher": "github"})
+        mock_wrapper.wrap_and_validate.return_value = {"id": "event-1"}
+        mock_producer.send_canonical_event = AsyncMock(side_effect=RuntimeError("publish timed out"))
+        mock_producer.send_mapping_failure = FastAsyncStub()
+
+        service = MappingService()
+        await service._process_raw_event({"id": "event-1", "source": "github", "payload": {}})
+
+        assert service.events_mapped == 0
+        assert service.events_failed > 0
+        failure_event = mock_producer.send_mapping_failure.call_args[0][0]
+        assert "publish timed out" in failure_event["error"]
+
+
 if __name__ == "__main__":
     import os
     os.environ['MAPPINGS_DIR'] = './mappings'
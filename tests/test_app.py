@@ -1,54 +1,79 @@
 """Test the health endpoint and basic app functionality."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import json
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 
 from langhook.app import app
+from tests.utils import FastAsyncStub
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-def client():
-    """Create a test client for the consolidated FastAPI app."""
-    with patch('langhook.ingest.nats.nats_producer') as mock_nats, \
-         patch('langhook.map.service.mapping_service') as mock_mapping, \
-         patch('langhook.ingest.middleware.RateLimitMiddleware.is_rate_limited') as mock_rate_limit, \
-         patch('nats.connect') as mock_nats_connect:
-        mock_nats.start = AsyncMock()
-        mock_nats.stop = AsyncMock()
-        mock_nats.send_raw_event = AsyncMock()
-        mock_nats.send_dlq = AsyncMock()
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-        mock_mapping.run = AsyncMock()
+
+@pytest.fixture(scope="module")
+def mocks():
+    """Patch NATS, the mapping service and rate limiting once for this module."""
+    with ExitStack() as stack:
+        mock_nats = stack.enter_context(patch('langhook.ingest.nats.nats_producer'))
+        mock_mapping = stack.enter_context(patch('langhook.map.service.mapping_service'))
+        mock_rate_limit = stack.enter_context(
+            patch('langhook.ingest.middleware.RateLimitMiddleware.is_rate_limited')
+        )
+        mock_nats_connect = stack.enter_context(patch('nats.connect'))
+
+        mock_nats.start = FastAsyncStub()
+        mock_nats.stop = FastAsyncStub()
+        mock_nats.send_raw_event = FastAsyncStub()
+        mock_nats.send_dlq = FastAsyncStub()
+
+        mock_mapping.run = FastAsyncStub()
 
         # Mock rate limiting to always return False (not rate limited)
         mock_rate_limit.return_value = False
 
         # Mock NATS connection
-        from unittest.mock import Mock
         mock_nc = AsyncMock()
         mock_js = Mock()  # JetStream should be sync mock
-        mock_js.publish = AsyncMock()
+        mock_js.publish = FastAsyncStub()
         mock_nc.jetstream = Mock(return_value=mock_js)  # jetstream() should return sync
-        mock_nc.close = AsyncMock()
+        mock_nc.close = FastAsyncStub()
         mock_nats_connect.return_value = mock_nc
 
-        # Override lifespan for testing by creating a simple mock lifespan
-        from contextlib import asynccontextmanager
+        yield SimpleNamespace(nats=mock_nats, mapping=mock_mapping, js=mock_js)
 
-        @asynccontextmanager
-        async def mock_lifespan(app):
-            yield
 
-        app.router.lifespan_context = mock_lifespan
-        with TestClient(app) as client:
-            yield client
+@pytest.fixture(autouse=True)
+def reset_mocks(mocks):
+    """Clear recorded calls so each test starts from a clean set of mocks."""
+    yield
+    for stub in (mocks.nats.send_raw_event, mocks.nats.send_dlq, mocks.js.publish):
+        stub.reset_mock()
 
 
-def test_health_endpoint(client):
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client(mocks):
+    """Create an ASGI test client for the consolidated FastAPI app.
+
+    The client is built once per module and drives the app in-process on the
+    session's event loop. ASGITransport does not send lifespan events, so no
+    NATS or database startup runs.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+
+
+async def test_health_endpoint(client):
     """Test the health check endpoint."""
-    response = client.get("/health/")
+    response = await client.get("/health/")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "up"
@@ -57,74 +82,97 @@ def test_health_endpoint(client):
     assert data["services"]["map"] == "up"
 
 
-def test_ingest_endpoint_valid_json(client):
+async def test_ingest_endpoint_valid_json(client):
     """Test ingesting valid JSON payload."""
-    with patch('langhook.ingest.nats.nats_producer') as mock_nats:
-        mock_nats.send_raw_event = AsyncMock()
-
-        payload = {"test": "data", "value": 123}
-        response = client.post(
-            "/ingest/github",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+    payload = {"test": "data", "value": 123}
+    response = await client.post(
+        "/ingest/github",
+        json=payload,
+        headers=JSON_HEADERS
+    )
 
-        assert response.status_code == 202
-        assert "request_id" in response.json()
-        assert response.json()["message"] == "Event accepted"
-        assert "X-Request-ID" in response.headers
+    assert response.status_code == 202
+    assert "request_id" in response.json()
+    assert response.json()["message"] == "Event accepted"
+    assert "X-Request-ID" in response.headers
 
 
-def test_ingest_endpoint_invalid_json(client):
+async def test_ingest_endpoint_invalid_json(client):
     """Test ingesting invalid JSON payload."""
-    with patch('langhook.ingest.nats.nats_producer') as mock_nats:
-        mock_nats.send_dlq = AsyncMock()
+    response = await client.post(
+        "/ingest/github",
+        content="invalid json {",
+        headers=JSON_HEADERS
+    )
 
-        response = client.post(
+    assert response.status_code == 400
+    assert "Invalid JSON payload" in response.json()["detail"]
+
+
+async def test_ingest_endpoint_bom_body_is_not_spliced(client):
+    """Test that a UTF-8 BOM body is accepted but re-serialized rather than spliced."""
+    with patch('langhook.app.nats_producer') as mock_producer:
+        mock_producer.send_raw_event = FastAsyncStub()
+        response = await client.post(
             "/ingest/github",
-            content="invalid json {",
-            headers={"Content-Type": "application/json"}
+            content=b'\xef\xbb\xbf{"value": NaN}',
+            headers=JSON_HEADERS
         )
 
-        assert response.status_code == 400
-        assert "Invalid JSON payload" in response.json()["detail"]
+    assert response.status_code == 202
+    args, kwargs = mock_producer.send_raw_event.call_args
+    assert kwargs["raw_payload"] is None
+    assert "value" in args[0]["payload"]
 
 
-def test_ingest_endpoint_body_too_large(client):
-    """Test request body size limit."""
-    large_payload = {"data": "x" * 2000000}  # > 1 MiB
+@pytest.fixture(scope="module")
+def oversize_body():
+    """Pre-encoded JSON body larger than the 1 MiB ingest limit."""
+    return b'{"data":"' + b"x" * 2_000_000 + b'"}'
+
 
-    response = client.post(
+async def test_ingest_endpoint_body_too_large(client, oversize_body):
+    """Test request body size limit."""
+    response = await client.post(
         "/ingest/test",
-        json=large_payload,
-        headers={"Content-Type": "application/json"}
+        content=oversize_body,
+        headers=JSON_HEADERS
     )
 
     assert response.status_code == 413
     assert "Request body too large" in response.json()["detail"]
 
 
-def test_ingest_endpoint_different_sources(client):
-    """Test that different sources are handled correctly."""
-    with patch('langhook.ingest.nats.nats_producer') as mock_nats:
-        mock_nats.send_raw_event = AsyncMock()
+async def test_ingest_endpoint_body_too_large_without_content_length(client, oversize_body):
+    """Test that the size limit also applies to chunked bodies."""
+    async def chunks():
+        for start in range(0, len(oversize_body), 65536):
+            yield oversize_body[start:start + 65536]
 
-        payload = {"test": "data"}
+    response = await client.post(
+        "/ingest/test",
+        content=chunks(),
+        headers=JSON_HEADERS
+    )
 
-        # Test GitHub source
-        response = client.post("/ingest/github", json=payload)
-        assert response.status_code == 202
+    assert response.status_code == 413
+    assert "Request body too large" in response.json()["detail"]
 
-        # Test Stripe source
-        response = client.post("/ingest/stripe", json=payload)
-        assert response.status_code == 202
 
-        # Test custom source
-        response = client.post("/ingest/custom-app", json=payload)
-        assert response.status_code == 202
+async def test_ingest_endpoint_different_sources(client):
+    """Test that different sources are handled correctly."""
+    body = json.dumps({"test": "data"}).encode()
+    sources = ("github", "stripe", "custom-app")
 
+    responses = await asyncio.gather(
+        *(client.post(f"/ingest/{source}", content=body, headers=JSON_HEADERS) for source in sources)
+    )
 
-def test_map_metrics_endpoint(client):
+    for source, response in zip(sources, responses):
+        assert response.status_code == 202, source
+
+
+async def test_map_metrics_endpoint(client):
     """Test map metrics endpoint."""
     with patch('langhook.app.mapping_service') as mock_service:
         mock_service.get_metrics.return_value = {
@@ -136,9 +184,27 @@ def test_map_metrics_endpoint(client):
             "llm_usage_rate": 0.03
         }
 
-        response = client.get("/map/metrics/json")
+        response = await client.get("/map/metrics/json")
         assert response.status_code == 200
         data = response.json()
         assert data["events_processed"] == 100
         assert data["events_mapped"] == 95
         assert data["mapping_success_rate"] == 0.95
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"x-delivery-seq": 2 ** 64}],
+    ids=["plain", "big_int_header"],
+)
+async def test_raw_event_splices_original_payload_bytes(headers):
+    """Test that the raw event envelope embeds the request body verbatim."""
+    from langhook.ingest.nats import NATSEventProducer
+
+    body = b'{"action": "opened", "pull_request": {"number": 1374}}'
+    event = {"id": "req-1", "source": "github", "headers": headers, "payload": {"ignored": True}}
+
+    message = NATSEventProducer._splice_payload(event, body)
+
+    assert body in message
+    assert json.loads(message) == {**event, "payload": json.loads(body)}
@@ -0,0 +1,29 @@
+"""Test the frontend bundle built with and without SERVER_PATH."""
+
+import shutil
+
+import pytest
+
+pytestmark = [
+    # Frontend tooling tests share one xdist worker so builds are not repeated
+    pytest.mark.xdist_group("frontend_build"),
+    pytest.mark.skipif(
+        shutil.which("npm") is None or shutil.which("node") is None,
+        reason="npm/node not installed"
+    ),
+]
+
+
+@pytest.mark.parametrize("server_path,expect_langhook", [("/langhook", True), ("", False)])
+def test_frontend_build_server_path(built_js, server_path, expect_langhook):
+    """Test that API paths and the router basename follow SERVER_PATH."""
+    js_content = built_js[server_path]
+
+    # API calls are prefixed with the server path only when it is configured
+    if expect_langhook:
+        assert '/langhook' in js_content, "Server path should be present in built JS for API calls"
+    else:
+        assert '/langhook' not in js_content, "Server path should not be present when not configured"
+
+    # Router basename matches the server path
+    assert f'basename:"{server_path}"' in js_content, "Router basename not configured correctly"
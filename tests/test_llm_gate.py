@@ -1,8 +1,12 @@
 """Tests for LLM Gate functionality."""
 
+import json
+import sys
+from collections.abc import Mapping
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from langhook.subscriptions.gate import LLMGateService
 from langhook.subscriptions.prompts import PromptLibrary
@@ -12,17 +16,26 @@ from langhook.subscriptions.schemas import GateConfig
 class TestLLMGateService:
     """Test LLM Gate service functionality."""
 
-    @pytest.fixture
-    def gate_service(self):
-        """Create a gate service for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gate_service(cls):
+        """Create a gate service for testing, shared across the class."""
         service = LLMGateService()
         service.llm_service = Mock()
         service.llm_service.is_available.return_value = True
         service.llm_service.llm = AsyncMock()
         return service
 
-    @pytest.fixture
-    def sample_event_data(self):
+    @pytest.fixture(autouse=True)
+    def reset_gate_service(self, gate_service):
+        """Restore the shared gate service mocks after each test."""
+        yield
+        gate_service.llm_service.llm.ainvoke.reset_mock(return_value=True, side_effect=True)
+        gate_service.llm_service.is_available.return_value = True
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_event_data(cls):
         """Sample event data for testing."""
         return {
             "publisher": "github",
@@ -36,8 +49,9 @@ class TestLLMGateService:
             }
         }
 
-    @pytest.fixture
-    def gate_config(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gate_config(cls):
         """Sample gate configuration."""
         return {
             "enabled": True,
@@ -78,6 +92,21 @@ class TestLLMGateService:
         assert should_pass is False
         assert reason is not None
 
+    @pytest.mark.asyncio
+    async def test_evaluate_event_disabled_gate_skips_llm(self, gate_service, sample_event_data, gate_config):
+        """Test that a disabled gate passes events without touching the LLM service."""
+        gate_service.llm_service.is_available.reset_mock()
+
+        should_pass, reason = await gate_service.evaluate_event(
+            event_data=sample_event_data,
+            gate_config={**gate_config, "enabled": False},
+            subscription_id=1
+        )
+
+        assert should_pass is True
+        assert reason == "Gate disabled"
+        gate_service.llm_service.is_available.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_failover_policy_fail_open(self, gate_service, sample_event_data, gate_config):
         """Test fail-open policy when LLM is unavailable."""
@@ -92,6 +121,35 @@ class TestLLMGateService:
         assert should_pass is True
         assert "unavailable" in reason
 
+    @pytest.mark.asyncio
+    async def test_evaluate_events_preserves_order_and_fails_open(self, gate_service, sample_event_data, gate_config):
+        """Test that batch evaluation keeps input order and fails open on errors."""
+        results = [(False, "blocked"), RuntimeError("boom"), (True, "passed")]
+
+        with patch.object(gate_service, "evaluate_event", AsyncMock(side_effect=results)) as mock_evaluate:
+            decisions = await gate_service.evaluate_events(
+                [(sample_event_data, gate_config, subscription_id) for subscription_id in (1, 2, 3)]
+            )
+
+        assert mock_evaluate.await_count == 3
+        assert decisions[0] == (False, "blocked")
+        assert decisions[1][0] is True
+        assert "boom" in decisions[1][1]
+        assert decisions[2] == (True, "passed")
+
+    def test_create_user_prompt_embeds_event(self, gate_service, sample_event_data):
+        """Test that the prompt ends with the serialized event after the gate criteria."""
+        prompt = gate_service._create_user_prompt("Only high priority", sample_event_data)
+        assert prompt.startswith("Only high priority")
+        assert json.loads(prompt.split("Event to evaluate:\n", 1)[1]) == sample_event_data
+
+    def test_create_user_prompt_keeps_ints_beyond_64_bits(self, gate_service):
+        """Test that events with integers orjson cannot encode still reach the prompt."""
+        event_data = {"publisher": "github", "payload": {"id": 2 ** 64 + 1}}
+
+        prompt = gate_service._create_user_prompt("Only high priority", event_data)
+        assert json.loads(prompt.split("Event to evaluate:\n", 1)[1]) == event_data
+
     def test_parse_llm_response_valid_json(self, gate_service):
         """Test parsing of valid LLM JSON response."""
         response = '{"decision": true}'
@@ -116,6 +174,15 @@ Hope this helps!'''
         assert parsed["decision"] is False
         assert "reasoning" in parsed
 
+    def test_parse_llm_response_with_nested_json_in_prose(self, gate_service):
+        """Test that the first complete JSON object is extracted from surrounding prose."""
+        response = 'Thinking {about it}... {"decision": true, "meta": {"score": 0.9}} and {"decision": false}'
+
+        parsed = gate_service._parse_llm_response(response)
+
+        assert parsed["decision"] is True
+        assert parsed["meta"] == {"score": 0.9}
+
     def test_parse_llm_response_invalid_json(self, gate_service):
         """Test parsing of invalid LLM response."""
         response = "This is not JSON at all!"
@@ -150,7 +217,8 @@ Hope this helps!'''
         assert result is not None
         assert result["pattern"] == "langhook.events.github.pull_request.*.created"
 
-    def test_convert_to_pattern_and_gate_adds_description_as_gate_prompt(self):
+    @pytest.mark.asyncio
+    async def test_convert_to_pattern_and_gate_adds_description_as_gate_prompt(self):
         """Test that convert_to_pattern_and_gate uses description as gate_prompt when gate is enabled."""
         from unittest.mock import AsyncMock
 
@@ -162,30 +230,30 @@ Hope this helps!'''
         description = "GitHub pull requests"
         expected_pattern = "langhook.events.github.pull_request.*.created"
 
-        with patch.object(LLMPatternService, '__init__', return_value=None):
+        with patch.multiple(
+            LLMPatternService,
+            __init__=Mock(return_value=None),
+            _get_system_prompt_with_schemas=AsyncMock(return_value="mock_system_prompt"),
+            _create_user_prompt=Mock(return_value="mock_user_prompt"),
+            _is_no_schema_response=Mock(return_value=False),
+            _parse_llm_response=Mock(return_value={"pattern": expected_pattern}),
+        ):
             service = LLMPatternService()
 
-            # Mock the internal method calls to simulate successful pattern extraction
-            with patch.object(service, '_get_system_prompt_with_schemas', return_value="mock_system_prompt"):
-                with patch.object(service, '_create_user_prompt', return_value="mock_user_prompt"):
-                    with patch.object(service, '_is_no_schema_response', return_value=False):
-                        with patch.object(service, '_parse_llm_response', return_value={"pattern": expected_pattern}):
-                            # Mock the LLM service parts
-                            service.llm = AsyncMock()
-                            service.llm.ainvoke.return_value.content = expected_pattern
-
-                            import asyncio
+            # Mock the LLM service parts
+            service.llm = AsyncMock()
+            service.llm.ainvoke.return_value.content = expected_pattern
 
-                            # Test with gate_enabled=False
-                            result_no_gate = asyncio.run(service.convert_to_pattern_and_gate(description, gate_enabled=False))
-                            assert "pattern" in result_no_gate
-                            assert "gate_prompt" not in result_no_gate
+            # Test with gate_enabled=False
+            result_no_gate = await service.convert_to_pattern_and_gate(description, gate_enabled=False)
+            assert "pattern" in result_no_gate
+            assert "gate_prompt" not in result_no_gate
 
-                            # Test with gate_enabled=True
-                            result_with_gate = asyncio.run(service.convert_to_pattern_and_gate(description, gate_enabled=True))
-                            assert "pattern" in result_with_gate
-                            assert "gate_prompt" in result_with_gate
-                            assert result_with_gate["gate_prompt"] == description
+            # Test with gate_enabled=True
+            result_with_gate = await service.convert_to_pattern_and_gate(description, gate_enabled=True)
+            assert "pattern" in result_with_gate
+            assert "gate_prompt" in result_with_gate
+            assert result_with_gate["gate_prompt"] == description
 
 
 class TestGateConfigSchema:
@@ -209,45 +277,79 @@ class TestGateConfigSchema:
         assert config.enabled is True
         assert config.prompt == "Test prompt for evaluation"
 
+    def test_gate_config_is_immutable(self):
+        """Test that gate configs are frozen and updated by copying."""
+        config = GateConfig(enabled=True)
+
+        with pytest.raises(ValidationError):
+            config.prompt = "changed"
+
+        updated = config.model_copy(update={"prompt": "changed"})
+        assert updated.prompt == "changed"
+        assert config.prompt == ""
+
 
 class TestPromptLibrary:
     """Test prompt library functionality (fallback templates)."""
 
-    def test_prompt_library_loads_defaults(self):
-        """Test that prompt library loads default fallback templates."""
-        library = PromptLibrary()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def library(cls):
+        """Create a prompt library shared across the class."""
+        return PromptLibrary()
+
+    @pytest.mark.parametrize("name", ["default", "strict", "precise", "security_focused", "exact_match"])
+    def test_prompt_library_loads_defaults(self, library, name):
+        """Test that prompt library loads each default fallback template."""
+        assert name in library.templates
+        assert library.get_template(name)
+
+    def test_templates_are_read_only(self, library):
+        """Test that loaded templates cannot be modified in place."""
+        with pytest.raises(TypeError):
+            library.templates["default"] = "changed"
+
+    def test_yaml_template_names_are_interned(self, tmp_path):
+        """Test that template names loaded from YAML are interned."""
+        (tmp_path / "gate_templates.yaml").write_text(
+            "templates:\n  custom_gate: 'Only pass {description}'\n", encoding="utf-8"
+        )
 
-        assert "default" in library.templates
-        assert "strict" in library.templates
-        assert "precise" in library.templates
-        assert "security_focused" in library.templates
-        assert "exact_match" in library.templates
+        library = PromptLibrary(prompts_dir=str(tmp_path))
 
-    def test_get_template(self):
-        """Test getting a template by name."""
-        library = PromptLibrary()
+        name = next(iter(library.templates))
+        assert name is sys.intern("custom_gate")
+        assert library.get_template("custom_gate") == "Only pass {description}"
 
+    def test_get_template(self, library):
+        """Test getting a template by name."""
         default_template = library.get_template("default")
         assert "intelligent event filter" in default_template.lower()
         # Updated to only expect decision in JSON response
         assert "decision" in default_template
         assert "{event_data}" in default_template
 
-    def test_get_nonexistent_template(self):
+    def test_get_nonexistent_template(self, library):
         """Test getting a non-existent template returns default."""
-        library = PromptLibrary()
-
         template = library.get_template("nonexistent")
         assert template == library.get_template("default")
 
-    def test_list_templates(self):
+    def test_list_templates(self, library):
         """Test listing all templates."""
-        library = PromptLibrary()
-
         templates = library.list_templates()
-        assert isinstance(templates, dict)
+        assert isinstance(templates, Mapping)
         assert "default" in templates
 
         # Should be truncated summaries
         for summary in templates.values():
             assert len(summary) <= 103  # 100 + "..."
+
+        # Summaries are built once and shared read-only between callers
+        assert library.list_templates() is templates
+        with pytest.raises(TypeError):
+            templates["default"] = "changed"
+
+        # Reloading rebuilds the summaries
+        library.reload_templates()
+        assert library.list_templates() is not templates
+        assert library.list_templates() == templates
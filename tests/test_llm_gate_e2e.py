@@ -1,22 +1,29 @@
 """End-to-end test for LLM Gate functionality."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock
 from fastapi.testclient import TestClient
 
 from langhook.subscriptions.schemas import SubscriptionCreate, GateConfig
 
 
+@pytest.mark.e2e
 class TestLLMGateE2E:
     """End-to-end tests for LLM Gate functionality."""
 
-    @pytest.fixture
-    def mock_services(self):
-        """Mock all required services for E2E testing."""
-        with patch('langhook.subscriptions.database.db_service') as mock_db, \
-             patch('langhook.subscriptions.llm.llm_service') as mock_llm, \
-             patch('langhook.subscriptions.gate.llm_gate_service') as mock_gate:
-            
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_services(cls):
+        """Mock all required services for E2E testing, shared across the class."""
+        mock_db = MagicMock()
+        mock_llm = MagicMock()
+        mock_gate = MagicMock()
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("langhook.subscriptions.database.db_service", mock_db)
+            mp.setattr("langhook.subscriptions.llm.llm_service", mock_llm)
+            mp.setattr("langhook.subscriptions.gate.llm_gate_service", mock_gate)
+
             # Mock subscription
             mock_subscription = Mock()
             mock_subscription.id = 1
@@ -61,19 +68,36 @@ class TestLLMGateE2E:
                 "subscription": mock_subscription
             }
 
-    @pytest.fixture
-    def client(self, mock_services):
-        """Create a test client with mocked services."""
-        with patch('langhook.ingest.nats.nats_producer') as mock_nats, \
-             patch('langhook.map.service.mapping_service') as mock_mapping, \
-             patch('langhook.ingest.middleware.RateLimitMiddleware.is_rate_limited') as mock_rate_limit, \
-             patch('nats.connect') as mock_nats_connect:
+    @pytest.fixture(autouse=True)
+    def reset_mock_services(self, request):
+        """Clear recorded calls on the shared service mocks after each test."""
+        yield
+        if "mock_services" in request.fixturenames:
+            mock_services = request.getfixturevalue("mock_services")
+            for name in ("db", "llm", "gate"):
+                mock_services[name].reset_mock()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, mock_services):
+        """Create a test client with mocked services, shared across the class."""
+        mock_nats = MagicMock()
+        mock_mapping = MagicMock()
+        mock_nats_connect = MagicMock()
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("langhook.ingest.nats.nats_producer", mock_nats)
+            mp.setattr("langhook.map.service.mapping_service", mock_mapping)
+            mp.setattr(
+                "langhook.ingest.middleware.RateLimitMiddleware.is_rate_limited",
+                Mock(return_value=False)
+            )
+            mp.setattr("nats.connect", mock_nats_connect)
 
             # Mock NATS
             mock_nats.start = AsyncMock()
             mock_nats.stop = AsyncMock()
             mock_mapping.run = AsyncMock()
-            mock_rate_limit.return_value = False
 
             # Mock NATS connection
             mock_nc = AsyncMock()
@@ -83,16 +107,12 @@ class TestLLMGateE2E:
             mock_nc.close = AsyncMock()
             mock_nats_connect.return_value = mock_nc
 
-            # Create test client
+            # Create test client; it is not entered as a context manager,
+            # so the app lifespan never runs
             from langhook.app import app
-            from contextlib import asynccontextmanager
-
-            @asynccontextmanager
-            async def mock_lifespan(app):
-                yield
-
-            app.router.lifespan_context = mock_lifespan
-            return TestClient(app)
+            client = TestClient(app)
+            yield client
+            client.close()
 
     def test_create_subscription_with_llm_gate(self, client, mock_services):
         """Test creating a subscription with LLM gate enabled."""
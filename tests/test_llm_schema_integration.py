@@ -5,20 +5,63 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from langhook.subscriptions.llm import LLMPatternService
+from langhook.subscriptions.schema_registry import schema_registry_service
+from tests.utils import assert_all_in
+
+
+# Schema summaries as returned by get_schema_summary; the prompt builder only reads them
+GITHUB_STRIPE_SCHEMA = {
+    "publishers": ["github", "stripe"],
+    "resource_types": {
+        "github": ["pull_request", "repository"],
+        "stripe": ["refund"]
+    },
+    "actions": ["created", "updated", "deleted"]
+}
+
+GRANULAR_SCHEMA = {
+    **GITHUB_STRIPE_SCHEMA,
+    "publisher_resource_actions": {
+        "github": {
+            "pull_request": ["created", "updated", "deleted"],
+            "repository": ["created", "updated"]
+        },
+        "stripe": {
+            "refund": ["created", "updated"]
+        }
+    }
+}
+
+GITHUB_PR_SCHEMA = {
+    "publishers": ["github"],
+    "resource_types": {"github": ["pull_request"]},
+    "actions": ["created"]
+}
+
+EMPTY_SCHEMA = {
+    "publishers": [],
+    "resource_types": {},
+    "actions": [],
+    "publisher_resource_actions": {}
+}
+
+
+class ContentString(str):
+    """String whose strip() returns itself unchanged."""
+    def strip(self):
+        return self
 
 
 class MockLLMResponse:
     """Mock object to simulate LLM response with content attribute."""
     def __init__(self, content: str):
         self._content = content
+        self._wrapped = ContentString(content)
 
     @property
     def content(self):
         # Return a string-like object that also has strip method
-        class ContentString(str):
-            def strip(self):
-                return self
-        return ContentString(self._content)
+        return self._wrapped
 
     def strip(self):
         return self._content.strip()
@@ -46,95 +89,89 @@ class TestLLMSchemaIntegration:
                 return service
 
     @pytest.mark.asyncio
-    async def test_system_prompt_with_registered_schemas(self, llm_service):
+    async def test_system_prompt_with_registered_schemas(self, llm_service, patched_schema_registry):
         """Test that system prompt includes registered schema data."""
-        mock_schema_data = {
-            "publishers": ["github", "stripe"],
-            "resource_types": {
-                "github": ["pull_request", "repository"],
-                "stripe": ["refund"]
-            },
-            "actions": ["created", "updated", "deleted"]
-        }
-
-        with patch('langhook.subscriptions.schema_registry.schema_registry_service') as mock_registry:
-            mock_registry.get_schema_summary = AsyncMock(return_value=mock_schema_data)
+        patched_schema_registry.return_value = GITHUB_STRIPE_SCHEMA
 
-            prompt = await llm_service._get_system_prompt_with_schemas()
+        prompt = await llm_service._get_system_prompt_with_schemas()
 
-            # Check that actual schema data is included (fallback format since no granular data)
-            assert "github, stripe" in prompt
-            assert "created, updated, deleted" in prompt
-            assert "github: pull_request, repository" in prompt
-            assert "stripe: refund" in prompt
-            assert "ONLY use the publishers, resource types, and actions listed above" in prompt
+        # Check that actual schema data is included (fallback format since no granular data)
+        assert_all_in(prompt, [
+            "github, stripe",
+            "created, updated, deleted",
+            "github: pull_request, repository",
+            "stripe: refund",
+            "ONLY use the publishers, resource types, and actions listed above",
+        ])
 
     @pytest.mark.asyncio
-    async def test_system_prompt_with_granular_schemas(self, llm_service):
+    async def test_system_prompt_with_granular_schemas(self, llm_service, patched_schema_registry):
         """Test that system prompt uses granular schema format when available."""
-        mock_schema_data = {
-            "publishers": ["github", "stripe"],
-            "resource_types": {
-                "github": ["pull_request", "repository"],
-                "stripe": ["refund"]
-            },
-            "actions": ["created", "updated", "deleted"],
-            "publisher_resource_actions": {
-                "github": {
-                    "pull_request": ["created", "updated", "deleted"],
-                    "repository": ["created", "updated"]
-                },
-                "stripe": {
-                    "refund": ["created", "updated"]
-                }
-            }
-        }
+        patched_schema_registry.return_value = GRANULAR_SCHEMA
 
-        with patch('langhook.subscriptions.schema_registry.schema_registry_service') as mock_registry:
-            mock_registry.get_schema_summary = AsyncMock(return_value=mock_schema_data)
+        prompt = await llm_service._get_system_prompt_with_schemas()
 
-            prompt = await llm_service._get_system_prompt_with_schemas()
+        # Check that granular schema data is included
+        assert_all_in(prompt, [
+            "github, stripe",
+            "github.pull_request: created, updated, deleted",
+            "github.repository: created, updated",
+            "stripe.refund: created, updated",
+            "ONLY use the exact publisher, resource type, and action combinations listed above",
+        ])
 
-            # Check that granular schema data is included
-            assert "github, stripe" in prompt
-            assert "github.pull_request: created, updated, deleted" in prompt
-            assert "github.repository: created, updated" in prompt
-            assert "stripe.refund: created, updated" in prompt
-            assert "ONLY use the exact publisher, resource type, and action combinations listed above" in prompt
-            
-            # Verify old format is NOT used
-            assert "Actions: created, updated, deleted" not in prompt
-            assert "Resource types by publisher:" not in prompt
+        # Verify old format is NOT used
+        assert "Actions: created, updated, deleted" not in prompt
+        assert "Resource types by publisher:" not in prompt
 
     @pytest.mark.asyncio
-    async def test_system_prompt_with_empty_schemas(self, llm_service):
+    async def test_system_prompt_with_empty_schemas(self, llm_service, patched_schema_registry):
         """Test that system prompt handles empty schema registry."""
-        mock_empty_data = {
-            "publishers": [],
-            "resource_types": {},
-            "actions": [],
-            "publisher_resource_actions": {}
-        }
-
-        with patch('langhook.subscriptions.schema_registry.schema_registry_service') as mock_registry:
-            mock_registry.get_schema_summary = AsyncMock(return_value=mock_empty_data)
+        patched_schema_registry.return_value = EMPTY_SCHEMA
 
-            prompt = await llm_service._get_system_prompt_with_schemas()
+        prompt = await llm_service._get_system_prompt_with_schemas()
 
-            # Should include instruction to reject all requests
-            assert "No event schemas are currently registered" in prompt
-            assert 'respond with "ERROR: No registered schemas available"' in prompt
+        # Should include instruction to reject all requests
+        assert_all_in(prompt, [
+            "No event schemas are currently registered",
+            'respond with "ERROR: No registered schemas available"',
+        ])
 
     @pytest.mark.asyncio
-    async def test_system_prompt_schema_fetch_error(self, llm_service):
+    async def test_system_prompt_schema_fetch_error(self, llm_service, patched_schema_registry):
         """Test that system prompt handles schema fetch errors gracefully."""
-        with patch('langhook.subscriptions.schema_registry.schema_registry_service') as mock_registry:
-            mock_registry.get_schema_summary = AsyncMock(side_effect=Exception("Database error"))
+        patched_schema_registry.side_effect = Exception("Database error")
 
-            prompt = await llm_service._get_system_prompt_with_schemas()
+        prompt = await llm_service._get_system_prompt_with_schemas()
 
-            # Should fall back to empty schema handling
-            assert "No event schemas are currently registered" in prompt
+        # Should fall back to empty schema handling
+        assert "No event schemas are currently registered" in prompt
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_cached_per_registry_version(self, llm_service, patched_schema_registry, monkeypatch):
+        """Test that the prompt is reused until the schema registry version changes."""
+        patched_schema_registry.return_value = GITHUB_PR_SCHEMA
+
+        first = await llm_service._get_system_prompt_with_schemas()
+        second = await llm_service._get_system_prompt_with_schemas()
+
+        assert second is first
+        assert patched_schema_registry.await_count == 1
+
+        monkeypatch.setattr(schema_registry_service, "version", schema_registry_service.version + 1)
+        await llm_service._get_system_prompt_with_schemas()
+
+        assert patched_schema_registry.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_fallback_is_not_cached(self, llm_service, patched_schema_registry):
+        """Test that a prompt built after a schema fetch error is not reused."""
+        patched_schema_registry.side_effect = Exception("Database error")
+
+        await llm_service._get_system_prompt_with_schemas()
+        await llm_service._get_system_prompt_with_schemas()
+
+        assert patched_schema_registry.await_count == 2
 
     def test_is_no_schema_response_detection(self, llm_service):
         """Test detection of 'no suitable schema' responses."""
@@ -151,29 +188,22 @@ class TestLLMSchemaIntegration:
         assert not llm_service._is_no_schema_response("Schema validation passed")
 
     @pytest.mark.asyncio
-    async def test_convert_to_pattern_with_no_suitable_schema(self, llm_service):
+    async def test_convert_to_pattern_with_no_suitable_schema(self, llm_service, patched_schema_registry):
         """Test that NoSuitableSchemaError is raised when LLM indicates no schema."""
         # This test demonstrates the concept but is complex to mock properly.
         # The functionality is tested via API integration tests instead.
-        mock_schema_data = {
-            "publishers": ["github"],
-            "resource_types": {"github": ["pull_request"]},
-            "actions": ["created"]
-        }
-
-        with patch('langhook.subscriptions.schema_registry.schema_registry_service') as mock_registry:
-            mock_registry.get_schema_summary = AsyncMock(return_value=mock_schema_data)
+        patched_schema_registry.return_value = GITHUB_PR_SCHEMA
 
-            # Create a proper mock response object with actual string content
-            mock_response = MockLLMResponse("ERROR: No suitable schema found")
-            llm_service.llm.ainvoke = AsyncMock(return_value=mock_response)
+        # Create a proper mock response object with actual string content
+        mock_response = MockLLMResponse("ERROR: No suitable schema found")
+        llm_service.llm.ainvoke = AsyncMock(return_value=mock_response)
 
-            # Note: This test is complex due to mocking challenges.
-            # The functionality is properly tested in test_subscription_schema_validation.py
-            # via API integration tests.
-            pytest.skip("Complex mocking - tested via API integration tests")
+        # Note: This test is complex due to mocking challenges.
+        # The functionality is properly tested in test_subscription_schema_validation.py
+        # via API integration tests.
+        pytest.skip("Complex mocking - tested via API integration tests")
 
-            assert "No suitable schema found" in str(exc_info.value)
+        assert "No suitable schema found" in str(exc_info.value)
 
     @pytest.mark.asyncio
     async def test_convert_to_pattern_with_valid_schema(self, llm_service):
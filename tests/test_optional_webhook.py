@@ -6,6 +6,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from langhook.app import app
+from tests.utils import noop_lifespan
 
 
 @pytest.fixture
@@ -33,15 +34,7 @@ def client():
                 mock_consumer_service.update_subscription = AsyncMock()
                 mock_get_consumer_service.return_value = mock_consumer_service
 
-                # Override lifespan for testing by creating a simple mock lifespan
-                from contextlib import asynccontextmanager
-
-                @asynccontextmanager
-                async def mock_lifespan(app):
-                    yield
-
-                app.router.lifespan_context = mock_lifespan
-                with TestClient(app) as client:
+                with patch.object(app.router, 'lifespan_context', noop_lifespan), TestClient(app) as client:
                     yield client, mock_db_service
 
 
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import AsyncMock, patch
 
 from langhook.subscriptions.llm import LLMPatternService
+from tests.utils import assert_all_in
 
 
 class TestRepositoryFilteringImprovement:
@@ -25,7 +26,7 @@ class TestRepositoryFilteringImprovement:
             return service
 
     @pytest.mark.asyncio
-    async def test_system_prompt_includes_repository_examples(self, llm_service):
+    async def test_system_prompt_includes_repository_examples(self, llm_service, patched_schema_registry):
         """Test that the system prompt includes repository-specific filtering examples."""
         mock_schema_data = {
             "publishers": ["github"],
@@ -39,16 +40,17 @@ class TestRepositoryFilteringImprovement:
             }
         }
         
-        with patch('langhook.subscriptions.schema_registry.schema_registry_service') as mock_registry:
-            mock_registry.get_schema_summary = AsyncMock(return_value=mock_schema_data)
-            
-            system_prompt = await llm_service._get_system_prompt_with_schemas(gate_enabled=True)
-            
-            # Check that repository-specific filtering examples are included
-            assert "backend-service" in system_prompt
-            assert "repository name is 'backend-service'" in system_prompt
-            assert "web-frontend repository" in system_prompt
-            assert "repository name is 'web-frontend'" in system_prompt
+        patched_schema_registry.return_value = mock_schema_data
+
+        system_prompt = await llm_service._get_system_prompt_with_schemas(gate_enabled=True)
+
+        # Check that repository-specific filtering examples are included
+        assert_all_in(system_prompt, [
+            "backend-service",
+            "repository name is 'backend-service'",
+            "web-frontend repository",
+            "repository name is 'web-frontend'",
+        ])
 
     def test_user_prompt_for_repository_case(self, llm_service):
         """Test user prompt generation for repository-specific cases."""
@@ -105,7 +107,7 @@ class TestRepositoryFilteringImprovement:
             assert "gate_prompt" in result, f"Test case {i+1} missing gate_prompt"
 
     @pytest.mark.asyncio
-    async def test_system_prompt_covers_issue_scenario(self, llm_service):
+    async def test_system_prompt_covers_issue_scenario(self, llm_service, patched_schema_registry):
         """Test that the system prompt helps with the specific issue scenario."""
         mock_schema_data = {
             "publishers": ["github"],
@@ -118,18 +120,17 @@ class TestRepositoryFilteringImprovement:
             }
         }
         
-        with patch('langhook.subscriptions.schema_registry.schema_registry_service') as mock_registry:
-            mock_registry.get_schema_summary = AsyncMock(return_value=mock_schema_data)
-            
-            system_prompt = await llm_service._get_system_prompt_with_schemas(gate_enabled=True)
-            
-            # Verify the system prompt contains relevant examples for repository filtering
-            # Should show conceptually similar examples without exact matching
-            assert "backend-service" in system_prompt or "web-frontend" in system_prompt
-            
-            # Check that the pattern examples show correct mapping
-            assert "langhook.events.github.pull_request.*.updated" in system_prompt
-            
-            # Verify gate prompt guidance
-            assert "repository name" in system_prompt
-            assert "AND" in system_prompt  # Shows conjunction pattern for filtering
\ No newline at end of file
+        patched_schema_registry.return_value = mock_schema_data
+
+        system_prompt = await llm_service._get_system_prompt_with_schemas(gate_enabled=True)
+
+        # Verify the system prompt contains relevant examples for repository filtering
+        # Should show conceptually similar examples without exact matching
+        assert "backend-service" in system_prompt or "web-frontend" in system_prompt
+
+        # Check that the pattern examples show correct mapping
+        assert "langhook.events.github.pull_request.*.updated" in system_prompt
+
+        # Verify gate prompt guidance
+        assert "repository name" in system_prompt
+        assert "AND" in system_prompt  # Shows conjunction pattern for filtering
\ No newline at end of file
@@ -1,47 +1,48 @@
 """Test resource type filtering functionality."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 from langhook.subscriptions.database import DatabaseService
-from langhook.subscriptions.models import EventLog
 
 
 @pytest.fixture
-def mock_db_service():
-    """Create a mock database service for testing."""
+def query_chain():
+    """Create a query mock whose chainable methods return the query itself."""
+    query = MagicMock()
+    for method in ("order_by", "filter", "offset", "limit"):
+        getattr(query, method).return_value = query
+    query.all.return_value = []
+    return query
+
+
+@pytest.fixture
+def mock_db_service(query_chain):
+    """Create a mock database service whose sessions return query_chain."""
     db_service = DatabaseService.__new__(DatabaseService)
     db_service.get_session = MagicMock()
+
+    mock_session = MagicMock()
+    mock_session.query.return_value = query_chain
+    db_service.get_session.return_value.__enter__.return_value = mock_session
+    db_service.get_session.return_value.__exit__.return_value = None
     return db_service
 
 
-@pytest.mark.asyncio 
-async def test_get_event_logs_with_resource_type_filter(mock_db_service):
+@pytest.mark.asyncio
+async def test_get_event_logs_with_resource_type_filter(mock_db_service, query_chain):
     """Test that get_event_logs properly filters by resource types."""
-    
-    # Mock session and query
-    mock_session = MagicMock()
-    mock_query = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.order_by.return_value = mock_query
-    mock_query.filter.return_value = mock_query
-    mock_query.offset.return_value = mock_query
-    mock_query.limit.return_value = mock_query
-    mock_query.count.return_value = 5
-    mock_query.all.return_value = []
-    
-    mock_db_service.get_session.return_value.__enter__.return_value = mock_session
-    mock_db_service.get_session.return_value.__exit__.return_value = None
-    
+    query_chain.count.return_value = 5
+
     # Test with resource type filter
     result = await mock_db_service.get_event_logs(
-        skip=0, 
-        limit=10, 
+        skip=0,
+        limit=10,
         resource_types=['pull_request', 'issue']
     )
-    
+
     # Verify filter was called with correct parameters
-    mock_query.filter.assert_called_once()
-    
+    query_chain.filter.assert_called_once()
+
     # Verify result structure
     assert isinstance(result, tuple)
     assert len(result) == 2
@@ -49,28 +50,16 @@ async def test_get_event_logs_with_resource_type_filter(mock_db_service):
 
 
 @pytest.mark.asyncio
-async def test_get_event_logs_without_filter(mock_db_service):
+async def test_get_event_logs_without_filter(mock_db_service, query_chain):
     """Test that get_event_logs works without resource type filter."""
-    
-    # Mock session and query
-    mock_session = MagicMock()
-    mock_query = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.order_by.return_value = mock_query
-    mock_query.offset.return_value = mock_query
-    mock_query.limit.return_value = mock_query
-    mock_query.count.return_value = 10
-    mock_query.all.return_value = []
-    
-    mock_db_service.get_session.return_value.__enter__.return_value = mock_session
-    mock_db_service.get_session.return_value.__exit__.return_value = None
-    
+    query_chain.count.return_value = 10
+
     # Test without resource type filter
     result = await mock_db_service.get_event_logs(skip=0, limit=10)
-    
+
     # Verify filter was NOT called
-    mock_query.filter.assert_not_called()
-    
+    query_chain.filter.assert_not_called()
+
     # Verify result structure
     assert isinstance(result, tuple)
     assert len(result) == 2
@@ -78,32 +67,20 @@ async def test_get_event_logs_without_filter(mock_db_service):
 
 
 @pytest.mark.asyncio
-async def test_get_event_logs_with_empty_filter(mock_db_service):
+async def test_get_event_logs_with_empty_filter(mock_db_service, query_chain):
     """Test that get_event_logs with empty resource types list works like no filter."""
-    
-    # Mock session and query
-    mock_session = MagicMock()
-    mock_query = MagicMock()
-    mock_session.query.return_value = mock_query
-    mock_query.order_by.return_value = mock_query
-    mock_query.offset.return_value = mock_query
-    mock_query.limit.return_value = mock_query
-    mock_query.count.return_value = 10
-    mock_query.all.return_value = []
-    
-    mock_db_service.get_session.return_value.__enter__.return_value = mock_session
-    mock_db_service.get_session.return_value.__exit__.return_value = None
-    
+    query_chain.count.return_value = 10
+
     # Test with empty resource type filter
     result = await mock_db_service.get_event_logs(
-        skip=0, 
-        limit=10, 
+        skip=0,
+        limit=10,
         resource_types=[]
     )
-    
+
     # Verify filter was NOT called for empty list
-    mock_query.filter.assert_not_called()
-    
+    query_chain.filter.assert_not_called()
+
     # Verify result structure
     assert isinstance(result, tuple)
     assert len(result) == 2
@@ -111,4 +88,4 @@ async def test_get_event_logs_with_empty_filter(mock_db_service):
 
 
 if __name__ == "__main__":
-    print("Test resource type filtering...")
\ No newline at end of file
+    print("Test resource type filtering...")
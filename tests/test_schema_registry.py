@@ -33,6 +33,24 @@ async def test_register_event_schema_success(schema_service):
         mock_session.commit.assert_called_once()
 
 
+@pytest.mark.parametrize("rowcount, expected_version", [(1, 1), (0, 0)])
+@pytest.mark.asyncio
+async def test_register_event_schema_bumps_version_on_insert(schema_service, rowcount, expected_version):
+    """Test that only newly inserted schema combinations bump the registry version."""
+    with patch('langhook.subscriptions.schema_registry.db_service') as mock_db:
+        mock_session = Mock()
+        mock_session.execute.return_value.rowcount = rowcount
+        mock_db.get_session.return_value.__enter__.return_value = mock_session
+
+        await schema_service.register_event_schema(
+            publisher="github",
+            resource_type="pull_request",
+            action="created"
+        )
+
+        assert schema_service.version == expected_version
+
+
 @pytest.mark.asyncio
 async def test_register_event_schema_sql_error(schema_service):
     """Test schema registration handles SQL errors gracefully."""
@@ -1,55 +1,54 @@
 """Test server path configuration for reverse proxy deployments."""
 
 import os
+from contextlib import ExitStack
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from langhook.app import app
 from langhook.core.config import load_app_config
+from tests.utils import FastAsyncStub, noop_lifespan
 
+# Keep the module on one xdist worker so the shared client is built once
+pytestmark = pytest.mark.xdist_group("server_path")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client_with_server_path():
-    """Create a test client with SERVER_PATH configured."""
-    with patch.dict(os.environ, {"SERVER_PATH": "/langhook", "OPENAI_API_KEY": "test"}):
+    """Create a test client with SERVER_PATH configured, shared across the module."""
+    with pytest.MonkeyPatch.context() as mp, ExitStack() as stack:
+        mp.setenv("SERVER_PATH", "/langhook")
+        mp.setenv("OPENAI_API_KEY", "test")
         # Force config reload to pick up new environment
-        with patch('langhook.core.config.app_config', load_app_config(reload=True)):
-            with patch('langhook.ingest.nats.nats_producer') as mock_nats, \
-                 patch('langhook.map.service.mapping_service') as mock_mapping, \
-                 patch('langhook.ingest.middleware.RateLimitMiddleware.is_rate_limited') as mock_rate_limit, \
-                 patch('nats.connect') as mock_nats_connect:
-                
-                mock_nats.start = AsyncMock()
-                mock_nats.stop = AsyncMock()
-                mock_nats.send_raw_event = AsyncMock()
-                mock_nats.send_dlq = AsyncMock()
-                mock_mapping.run = AsyncMock()
-                mock_rate_limit.return_value = False
-
-                # Mock NATS connection
-                from unittest.mock import Mock
-                mock_nc = AsyncMock()
-                mock_js = Mock()
-                mock_js.publish = AsyncMock()
-                mock_nc.jetstream = Mock(return_value=mock_js)
-                mock_nc.close = AsyncMock()
-                mock_nats_connect.return_value = mock_nc
-
-                # Import and create app after patching config
-                from langhook.app import app
-                
-                # Override lifespan for testing
-                from contextlib import asynccontextmanager
-
-                @asynccontextmanager
-                async def mock_lifespan(app):
-                    yield
-
-                app.router.lifespan_context = mock_lifespan
-                with TestClient(app) as client:
-                    yield client
+        mp.setattr("langhook.core.config.app_config", load_app_config(reload=True))
+
+        mock_nats = stack.enter_context(patch('langhook.ingest.nats.nats_producer'))
+        mock_mapping = stack.enter_context(patch('langhook.map.service.mapping_service'))
+        mock_rate_limit = stack.enter_context(
+            patch('langhook.ingest.middleware.RateLimitMiddleware.is_rate_limited')
+        )
+        mock_nats_connect = stack.enter_context(patch('nats.connect'))
+
+        mock_nats.start = FastAsyncStub()
+        mock_nats.stop = FastAsyncStub()
+        mock_nats.send_raw_event = FastAsyncStub()
+        mock_nats.send_dlq = FastAsyncStub()
+        mock_mapping.run = FastAsyncStub()
+        mock_rate_limit.return_value = False
+
+        # Mock NATS connection
+        mock_nc = AsyncMock()
+        mock_js = Mock()
+        mock_js.publish = FastAsyncStub()
+        mock_nc.jetstream = Mock(return_value=mock_js)
+        mock_nc.close = FastAsyncStub()
+        mock_nats_connect.return_value = mock_nc
+
+        stack.enter_context(patch.object(app.router, 'lifespan_context', noop_lifespan))
+        yield stack.enter_context(TestClient(app))
 
 
 def test_health_endpoint_with_server_path(client_with_server_path):
@@ -63,7 +62,7 @@ def test_health_endpoint_with_server_path(client_with_server_path):
 def test_ingest_endpoint_with_server_path(client_with_server_path):
     """Test ingest endpoint works with server path configured."""
     with patch('langhook.ingest.nats.nats_producer') as mock_nats:
-        mock_nats.send_raw_event = AsyncMock()
+        mock_nats.send_raw_event = FastAsyncStub()
 
         payload = {"test": "data", "value": 123}
         response = client_with_server_path.post(
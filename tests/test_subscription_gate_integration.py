@@ -1,11 +1,62 @@
 """Test subscription creation and updates with LLM Gate configuration."""
 
-import pytest
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
+import pytest
+
+from langhook.subscriptions.consumer_service import SubscriptionConsumer
 from langhook.subscriptions.database import DatabaseService
 from langhook.subscriptions.schemas import SubscriptionCreate, SubscriptionUpdate, GateConfig
-from langhook.subscriptions.models import Subscription
+
+# Static payloads, validated once at import
+IMPORTANT_PR_SUBSCRIPTION = SubscriptionCreate(
+    description="Important GitHub pull requests",
+    channel_type="webhook",
+    channel_config={"url": "https://example.com/webhook"},
+    gate=GateConfig(
+        enabled=True,
+        prompt="Custom evaluation prompt for important events"
+    )
+)
+ALL_GITHUB_SUBSCRIPTION = SubscriptionCreate(
+    description="All GitHub events",
+    channel_type="webhook",
+    channel_config={"url": "https://example.com/webhook"}
+    # No gate config
+)
+DISABLE_GATE_UPDATE = SubscriptionUpdate(
+    gate=GateConfig(
+        enabled=False,
+        prompt="Updated evaluation prompt"
+    )
+)
+
+# Read-only so a test that mutates the shared event fails loudly
+SAMPLE_EVENT = MappingProxyType({
+    "id": "test_event_123",
+    "source": "github",
+    "subject": "langhook.events.github.pull_request.123.created",
+    "data": {
+        "publisher": "github",
+        "resource": {"type": "pull_request", "id": 123},
+        "action": "created",
+        "timestamp": "2024-01-01T12:00:00Z",
+        "payload": {
+            "title": "Fix critical security vulnerability",
+            "author": "security@example.com",
+            "priority": "critical"
+        }
+    }
+})
+
+
+def _make_http_client_mock(status_code: int = 200) -> AsyncMock:
+    """Build an ``httpx.AsyncClient`` stand-in whose webhook posts return ``status_code``."""
+    client = AsyncMock()
+    client.__aenter__.return_value = client
+    client.post.return_value = Mock(status_code=status_code)
+    return client
 
 
 class TestSubscriptionWithGate:
@@ -13,48 +64,41 @@ class TestSubscriptionWithGate:
 
     @pytest.fixture
     def mock_db_service(self):
-        """Mock database service for testing."""
-        with patch('langhook.subscriptions.database.db_service') as mock_db:
-            # Setup mock subscription object
-            mock_subscription = Mock(spec=Subscription)
-            mock_subscription.id = 1
-            mock_subscription.subscriber_id = "test_user"
-            mock_subscription.description = "Important GitHub pull requests"
-            mock_subscription.pattern = "langhook.events.github.pull_request.*.*"
-            mock_subscription.channel_type = "webhook"
-            mock_subscription.channel_config = {"url": "https://example.com/webhook"}
-            mock_subscription.gate = {
+        """Mock database service for testing.
+
+        Tests only call the returned mock, so nothing is patched in the
+        database module.
+        """
+        # Setup mock subscription object
+        mock_subscription = SimpleNamespace(
+            id=1,
+            subscriber_id="test_user",
+            description="Important GitHub pull requests",
+            pattern="langhook.events.github.pull_request.*.*",
+            channel_type="webhook",
+            channel_config={"url": "https://example.com/webhook"},
+            gate={
                 "enabled": True,
                 "prompt": "You are evaluating GitHub events for importance..."
-            }
-            mock_subscription.active = True
+            },
+            active=True,
+            disposable=False
+        )
 
-            mock_db.create_subscription = AsyncMock(return_value=mock_subscription)
-            mock_db.update_subscription = AsyncMock(return_value=mock_subscription)
-            mock_db.get_subscription = AsyncMock(return_value=mock_subscription)
-            
-            yield mock_db
+        mock_db = Mock(spec=DatabaseService)
+        mock_db.create_subscription = AsyncMock(return_value=mock_subscription)
+        mock_db.update_subscription = AsyncMock(return_value=mock_subscription)
+        mock_db.get_subscription = AsyncMock(return_value=mock_subscription)
+        return mock_db
 
     @pytest.mark.asyncio
     async def test_create_subscription_with_gate(self, mock_db_service):
         """Test creating a subscription with LLM gate configuration."""
-        gate_config = GateConfig(
-            enabled=True,
-            prompt="Custom evaluation prompt for important events"
-        )
-        
-        subscription_data = SubscriptionCreate(
-            description="Important GitHub pull requests",
-            channel_type="webhook",
-            channel_config={"url": "https://example.com/webhook"},
-            gate=gate_config
-        )
-
         # Test creation
         result = await mock_db_service.create_subscription(
             subscriber_id="test_user",
             pattern="langhook.events.github.pull_request.*.*",
-            subscription_data=subscription_data
+            subscription_data=IMPORTANT_PR_SUBSCRIPTION
         )
 
         # Verify the call was made with correct gate data
@@ -66,21 +110,12 @@ class TestSubscriptionWithGate:
     @pytest.mark.asyncio
     async def test_update_subscription_gate_config(self, mock_db_service):
         """Test updating a subscription's gate configuration."""
-        new_gate_config = GateConfig(
-            enabled=False,
-            prompt="Updated evaluation prompt"
-        )
-        
-        update_data = SubscriptionUpdate(
-            gate=new_gate_config
-        )
-
         # Test update
         result = await mock_db_service.update_subscription(
             subscription_id=1,
             subscriber_id="test_user",
             pattern=None,
-            update_data=update_data
+            update_data=DISABLE_GATE_UPDATE
         )
 
         # Verify the call was made with correct gate data
@@ -92,17 +127,10 @@ class TestSubscriptionWithGate:
     @pytest.mark.asyncio
     async def test_create_subscription_without_gate(self, mock_db_service):
         """Test creating a subscription without gate configuration."""
-        subscription_data = SubscriptionCreate(
-            description="All GitHub events",
-            channel_type="webhook",
-            channel_config={"url": "https://example.com/webhook"}
-            # No gate config
-        )
-
         result = await mock_db_service.create_subscription(
             subscriber_id="test_user",
             pattern="langhook.events.github.*.*.*",
-            subscription_data=subscription_data
+            subscription_data=ALL_GITHUB_SUBSCRIPTION
         )
 
         # Verify the call was made without gate data
@@ -110,6 +138,10 @@ class TestSubscriptionWithGate:
         call_args = mock_db_service.create_subscription.call_args
         assert call_args[1]["subscription_data"].gate is None
 
+
+class TestGateConfigSchema:
+    """Test GateConfig validation without any service fixtures."""
+
     def test_gate_config_schema_validation(self):
         """Test that GateConfig validates correctly."""
         # Valid config
@@ -133,154 +165,125 @@ class TestSubscriptionConsumerWithGate:
     @pytest.fixture
     def mock_subscription_with_gate(self):
         """Mock subscription with gate enabled."""
-        subscription = Mock(spec=Subscription)
-        subscription.id = 1
-        subscription.subscriber_id = "test_user"
-        subscription.description = "Important GitHub pull requests"
-        subscription.pattern = "langhook.events.github.pull_request.*.*"
-        subscription.channel_type = "webhook"
-        subscription.channel_config = {"url": "https://example.com/webhook"}
-        subscription.gate = {
-            "enabled": True,
-            "prompt": "Evaluate GitHub events for importance..."
-        }
-        subscription.active = True
-        return subscription
+        return SimpleNamespace(
+            id=1,
+            subscriber_id="test_user",
+            description="Important GitHub pull requests",
+            pattern="langhook.events.github.pull_request.*.*",
+            channel_type="webhook",
+            channel_config={"url": "https://example.com/webhook"},
+            gate={
+                "enabled": True,
+                "prompt": "Evaluate GitHub events for importance..."
+            },
+            active=True,
+            disposable=False
+        )
 
     @pytest.fixture
     def mock_subscription_without_gate(self):
         """Mock subscription without gate enabled."""
-        subscription = Mock(spec=Subscription)
-        subscription.id = 2
-        subscription.subscriber_id = "test_user"
-        subscription.description = "All GitHub events"
-        subscription.pattern = "langhook.events.github.*.*.*"
-        subscription.channel_type = "webhook"
-        subscription.channel_config = {"url": "https://example.com/webhook"}
-        subscription.gate = None
-        subscription.active = True
-        return subscription
+        return SimpleNamespace(
+            id=2,
+            subscriber_id="test_user",
+            description="All GitHub events",
+            pattern="langhook.events.github.*.*.*",
+            channel_type="webhook",
+            channel_config={"url": "https://example.com/webhook"},
+            gate=None,
+            active=True,
+            disposable=False
+        )
 
     @pytest.fixture
     def sample_event_data(self):
         """Sample event data for testing."""
-        return {
-            "id": "test_event_123",
-            "source": "github",
-            "subject": "langhook.events.github.pull_request.123.created",
-            "data": {
-                "publisher": "github",
-                "resource": {"type": "pull_request", "id": 123},
-                "action": "created",
-                "timestamp": "2024-01-01T12:00:00Z",
-                "payload": {
-                    "title": "Fix critical security vulnerability",
-                    "author": "security@example.com",
-                    "priority": "critical"
-                }
-            }
-        }
+        return SAMPLE_EVENT
 
-    @pytest.mark.asyncio
-    async def test_consumer_processes_event_with_gate_pass(
-        self, 
-        mock_subscription_with_gate, 
-        sample_event_data
-    ):
-        """Test that consumer processes event when gate passes."""
-        from langhook.subscriptions.consumer_service import SubscriptionConsumer
-        
+    @pytest.fixture(scope="class")
+    @classmethod
+    def http_client_mock(cls):
+        """HTTP client mock shared by the class, with its recorded calls cleared per test."""
+        return _make_http_client_mock()
+
+    @pytest.fixture
+    def patched_consumer_deps(self, http_client_mock):
+        """Patch the gate service, database and HTTP client used by the consumer.
+
+        Yields ``(mock_gate, mock_db, http_client_mock)`` with the database
+        session already set up.
+        """
         with patch('langhook.subscriptions.consumer_service.llm_gate_service') as mock_gate, \
              patch('langhook.subscriptions.consumer_service.db_service') as mock_db, \
-             patch('httpx.AsyncClient') as mock_http:
-            
-            # Mock gate passes
-            mock_gate.evaluate_event = AsyncMock(return_value=(True, "Important security fix"))
-            
+             patch('httpx.AsyncClient', return_value=http_client_mock):
+
             # Mock database save
             mock_db.get_session = Mock()
             mock_db.get_session.return_value.__enter__ = Mock()
             mock_db.get_session.return_value.__exit__ = Mock()
-            
-            # Mock successful webhook
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_http.return_value.__aenter__ = AsyncMock(return_value=mock_http.return_value)
-            mock_http.return_value.__aexit__ = AsyncMock()
-            mock_http.return_value.post = AsyncMock(return_value=mock_response)
-
-            consumer = SubscriptionConsumer(mock_subscription_with_gate)
-            await consumer._handle_subscription_event(sample_event_data)
-
-            # Verify gate was called
-            mock_gate.evaluate_event.assert_called_once()
-            gate_call_args = mock_gate.evaluate_event.call_args[1]
-            assert gate_call_args["subscription_id"] == 1
-            assert gate_call_args["gate_config"] == mock_subscription_with_gate.gate
-
-            # Verify webhook was sent (since gate passed)
-            mock_http.return_value.post.assert_called_once()
+
+            yield mock_gate, mock_db, http_client_mock
+
+        http_client_mock.reset_mock()
+
+    @pytest.mark.asyncio
+    async def test_consumer_processes_event_with_gate_pass(
+        self,
+        mock_subscription_with_gate,
+        sample_event_data,
+        patched_consumer_deps
+    ):
+        """Test that consumer processes event when gate passes."""
+        mock_gate, _, http_client = patched_consumer_deps
+        mock_gate.evaluate_event = AsyncMock(return_value=(True, "Important security fix"))
+
+        consumer = SubscriptionConsumer(mock_subscription_with_gate)
+        await consumer._handle_subscription_event(sample_event_data)
+
+        # Verify gate was called
+        mock_gate.evaluate_event.assert_called_once()
+        gate_call_args = mock_gate.evaluate_event.call_args[1]
+        assert gate_call_args["subscription_id"] == 1
+        assert gate_call_args["gate_config"] == mock_subscription_with_gate.gate
+
+        # Verify webhook was sent (since gate passed)
+        http_client.post.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_consumer_blocks_event_when_gate_fails(
-        self, 
-        mock_subscription_with_gate, 
-        sample_event_data
+        self,
+        mock_subscription_with_gate,
+        sample_event_data,
+        patched_consumer_deps
     ):
         """Test that consumer blocks event when gate fails."""
-        from langhook.subscriptions.consumer_service import SubscriptionConsumer
-        
-        with patch('langhook.subscriptions.consumer_service.llm_gate_service') as mock_gate, \
-             patch('langhook.subscriptions.consumer_service.db_service') as mock_db, \
-             patch('httpx.AsyncClient') as mock_http:
-            
-            # Mock gate blocks
-            mock_gate.evaluate_event = AsyncMock(return_value=(False, "Not relevant enough"))
-            
-            # Mock database save
-            mock_db.get_session = Mock()
-            mock_db.get_session.return_value.__enter__ = Mock()
-            mock_db.get_session.return_value.__exit__ = Mock()
+        mock_gate, _, http_client = patched_consumer_deps
+        mock_gate.evaluate_event = AsyncMock(return_value=(False, "Not relevant enough"))
 
-            consumer = SubscriptionConsumer(mock_subscription_with_gate)
-            await consumer._handle_subscription_event(sample_event_data)
+        consumer = SubscriptionConsumer(mock_subscription_with_gate)
+        await consumer._handle_subscription_event(sample_event_data)
 
-            # Verify gate was called
-            mock_gate.evaluate_event.assert_called_once()
+        # Verify gate was called
+        mock_gate.evaluate_event.assert_called_once()
 
-            # Verify webhook was NOT sent (since gate blocked)
-            mock_http.return_value.post.assert_not_called()
+        # Verify webhook was NOT sent (since gate blocked)
+        http_client.post.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_consumer_bypasses_gate_when_disabled(
-        self, 
-        mock_subscription_without_gate, 
-        sample_event_data
+        self,
+        mock_subscription_without_gate,
+        sample_event_data,
+        patched_consumer_deps
     ):
         """Test that consumer bypasses gate when not enabled."""
-        from langhook.subscriptions.consumer_service import SubscriptionConsumer
-        
-        with patch('langhook.subscriptions.consumer_service.llm_gate_service') as mock_gate, \
-             patch('langhook.subscriptions.consumer_service.db_service') as mock_db, \
-             patch('httpx.AsyncClient') as mock_http:
-            
-            # Mock database save
-            mock_db.get_session = Mock()
-            mock_db.get_session.return_value.__enter__ = Mock()
-            mock_db.get_session.return_value.__exit__ = Mock()
-            
-            # Mock successful webhook
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_http.return_value.__aenter__ = AsyncMock(return_value=mock_http.return_value)
-            mock_http.return_value.__aexit__ = AsyncMock()
-            mock_http.return_value.post = AsyncMock(return_value=mock_response)
-
-            consumer = SubscriptionConsumer(mock_subscription_without_gate)
-            await consumer._handle_subscription_event(sample_event_data)
-
-            # Verify gate was NOT called
-            mock_gate.evaluate_event.assert_not_called()
-
-            # Verify webhook was sent (no gate to block)
-            mock_http.return_value.post.assert_called_once()
\ No newline at end of file
+        mock_gate, _, http_client = patched_consumer_deps
+
+        consumer = SubscriptionConsumer(mock_subscription_without_gate)
+        await consumer._handle_subscription_event(sample_event_data)
+
+        # Verify gate was NOT called
+        mock_gate.evaluate_event.assert_not_called()
+
+        # Verify webhook was sent (no gate to block)
+        http_client.post.assert_called_once()
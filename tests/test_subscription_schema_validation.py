@@ -4,9 +4,12 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 from langhook.app import app
+from langhook.subscriptions import schemas
 from langhook.subscriptions.llm import NoSuitableSchemaError
+from tests.utils import noop_lifespan
 
 
 @pytest.fixture
@@ -40,15 +43,7 @@ def client():
         # Mock database service
         mock_db_service.create_tables = Mock()
 
-        # Override lifespan for testing by creating a simple mock lifespan
-        from contextlib import asynccontextmanager
-
-        @asynccontextmanager
-        async def mock_lifespan(app):
-            yield
-
-        app.router.lifespan_context = mock_lifespan
-        with TestClient(app) as client:
+        with patch.object(app.router, 'lifespan_context', noop_lifespan), TestClient(app) as client:
             yield client
 
 
@@ -144,6 +139,33 @@ def test_subscription_creation_with_valid_schema(client):
         assert subscription["pattern"] == "langhook.events.github.pull_request.*.updated"
 
 
+@pytest.mark.parametrize(
+    "model",
+    [
+        schemas.GateConfig,
+        schemas.SubscriptionCreate,
+        schemas.SubscriptionUpdate,
+        schemas.SubscriptionResponse,
+        schemas.SubscriptionListResponse,
+    ],
+    ids=lambda model: model.__name__,
+)
+def test_subscription_schemas_are_built_at_import(model):
+    """Test that validators are built at import rather than on the first request."""
+    assert model.__pydantic_complete__
+
+
+@pytest.mark.parametrize(
+    "model",
+    [schemas.SubscriptionCreate, schemas.SubscriptionUpdate],
+    ids=lambda model: model.__name__,
+)
+def test_subscription_schemas_reject_unsupported_channel_type(model):
+    """Test that channel types outside SUPPORTED_CHANNEL_TYPES fail validation."""
+    with pytest.raises(ValidationError, match="channel_type must be: webhook"):
+        model(description="All GitHub events", channel_type="sms")
+
+
 if __name__ == "__main__":
     import subprocess
     subprocess.run(["python", "-m", "pytest", __file__, "-v"])
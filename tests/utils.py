@@ -0,0 +1,53 @@
+"""Shared helpers for the unit test suite."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+
+class FastAsyncStub:
+    """Lightweight awaitable stand-in for ``AsyncMock``.
+
+    Records every call as an ``(args, kwargs)`` tuple without the signature
+    checks and call-object bookkeeping that ``unittest.mock`` performs, which
+    keeps high-volume fixtures (producers, NATS clients) cheap to call.
+    """
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.return_value = return_value
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    @property
+    def called(self) -> bool:
+        """Whether the stub has been awaited at least once."""
+        return bool(self.calls)
+
+    @property
+    def call_count(self) -> int:
+        """Number of recorded calls."""
+        return len(self.calls)
+
+    @property
+    def call_args(self) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
+        """Arguments of the most recent call, mirroring ``Mock.call_args``."""
+        return self.calls[-1] if self.calls else None
+
+    def reset_mock(self) -> None:
+        """Forget all recorded calls."""
+        self.calls.clear()
+
+
+@asynccontextmanager
+async def noop_lifespan(app: Any) -> AsyncIterator[None]:
+    """Lifespan that skips NATS, database and background service startup."""
+    yield
+
+
+def assert_all_in(haystack: str, needles: list[str]) -> None:
+    """Assert that every needle occurs in haystack, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"missing from text: {missing}"